@@ -1,337 +1,528 @@
-"""
-Streamlit UI for Meeting Agent
-Interactive interface to run the agent and view results
-"""
-import streamlit as st
-import json
-import os
-from datetime import date
-from orchestrator import MeetingAgentOrchestrator
-import config
-
-
-def load_sample_transcripts():
-    """Load available sample transcripts"""
-    transcript_dir = "data"
-    if not os.path.exists(transcript_dir):
-        return {}
-    
-    transcripts = {}
-    for file in os.listdir(transcript_dir):
-        if file.endswith('.txt'):
-            with open(os.path.join(transcript_dir, file), 'r', encoding='utf-8') as f:
-                transcripts[file] = f.read()
-    
-    return transcripts
-
-
-def main():
-    st.set_page_config(
-        page_title="Meeting Agent",
-        page_icon="🤖",
-        layout="wide"
-    )
-    
-    st.title("🤖 AI Meeting Agent")
-    st.markdown("Transform meeting transcripts into actionable outputs")
-    
-    # Sidebar - Configuration
-    st.sidebar.header("⚙️ Configuration")
-    
-    # Check API key
-    try:
-        config.validate_config()
-        st.sidebar.success("✓ OpenAI API Key configured")
-    except ValueError as e:
-        st.sidebar.error(f"❌ {str(e)}")
-        st.error("Please configure your OpenAI API key in the .env file")
-        st.stop()
-    
-    # Reference date
-    reference_date = st.sidebar.date_input(
-        "Reference Date",
-        value=config.REFERENCE_DATE,
-        help="Date used for resolving relative deadlines like 'next Friday'"
-    )
-    
-    # Main content
-    tab1, tab2, tab3 = st.tabs(["📝 Input", "🚀 Process", "📊 Results"])
-    
-    with tab1:
-        st.header("Input Meeting Data")
-        
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            st.subheader("Meeting Transcript")
-            
-            # Load sample transcripts
-            samples = load_sample_transcripts()
-            
-            if samples:
-                sample_choice = st.selectbox(
-                    "Load sample transcript",
-                    ["Custom"] + list(samples.keys())
-                )
-                
-                if sample_choice != "Custom":
-                    transcript = samples[sample_choice]
-                else:
-                    transcript = ""
-            else:
-                transcript = ""
-            
-            transcript_input = st.text_area(
-                "Paste meeting transcript here",
-                value=transcript,
-                height=400,
-                help="Timestamped meeting transcript with speaker names"
-            )
-            
-            st.session_state['transcript'] = transcript_input
-        
-        with col2:
-            st.subheader("People Directory")
-            
-            people_file = st.file_uploader(
-                "Upload people.json",
-                type=['json'],
-                help="JSON file with names, roles, and emails"
-            )
-            
-            if people_file:
-                people_data = json.load(people_file)
-                st.session_state['people_data'] = people_data
-                st.success(f"✓ Loaded {len(people_data)} people")
-                
-                with st.expander("View people directory"):
-                    st.json(people_data)
-            
-            elif os.path.exists(config.PEOPLE_DIRECTORY_PATH):
-                with open(config.PEOPLE_DIRECTORY_PATH, 'r') as f:
-                    people_data = json.load(f)
-                    st.session_state['people_data'] = people_data
-                    st.info(f"Using default people.json ({len(people_data)} people)")
-            else:
-                st.warning("No people directory loaded")
-    
-    with tab2:
-        st.header("Process Meeting")
-        
-        if st.button("🚀 Run Agent", type="primary", use_container_width=True):
-            
-            if 'transcript' not in st.session_state or not st.session_state['transcript']:
-                st.error("Please provide a meeting transcript")
-                return
-            
-            if 'people_data' not in st.session_state:
-                st.error("Please provide a people directory")
-                return
-            
-            # Save temp files
-            temp_transcript = "data/temp_transcript.txt"
-            temp_people = "data/temp_people.json"
-            
-            os.makedirs("data", exist_ok=True)
-            
-            with open(temp_transcript, 'w', encoding='utf-8') as f:
-                f.write(st.session_state['transcript'])
-            
-            with open(temp_people, 'w', encoding='utf-8') as f:
-                json.dump(st.session_state['people_data'], f, indent=2)
-            
-            # Run orchestrator
-            with st.spinner("Processing meeting transcript..."):
-                try:
-                    orchestrator = MeetingAgentOrchestrator(
-                        transcript=st.session_state['transcript'],
-                        people_directory_path=temp_people,
-                        reference_date=reference_date
-                    )
-                    
-                    # Show progress
-                    progress_bar = st.progress(0)
-                    status = st.empty()
-                    
-                    # Import all stage functions at the start
-                    from stages.stage1_extraction import extract_intelligence
-                    from stages.stage2_owner_resolution import resolve_owners
-                    from stages.stage3_deadline_resolution import resolve_deadlines
-                    from stages.stage4_validation_agent import validate_state
-                    from stages.stage5_message_generator import generate_messages
-                    from stages.stage6_email_simulator import simulate_email_triggers
-                    
-                    status.text("Stage 1: Extracting intelligence...")
-                    progress_bar.progress(16)
-                    orchestrator.state = extract_intelligence(orchestrator.state)
-                    
-                    status.text("Stage 2: Resolving owners...")
-                    progress_bar.progress(33)
-                    orchestrator.state = resolve_owners(orchestrator.state)
-                    
-                    status.text("Stage 3: Resolving deadlines...")
-                    progress_bar.progress(50)
-                    orchestrator.state = resolve_deadlines(orchestrator.state)
-                    
-                    status.text("Stage 4: Running validation...")
-                    progress_bar.progress(66)
-                    orchestrator.state = validate_state(orchestrator.state)
-                    
-                    status.text("Stage 5: Generating messages...")
-                    progress_bar.progress(83)
-                    orchestrator.state = generate_messages(orchestrator.state)
-                    
-                    status.text("Stage 6: Simulating emails...")
-                    progress_bar.progress(95)
-                    orchestrator.state = simulate_email_triggers(orchestrator.state)
-                    
-                    status.text("Generating final output...")
-                    progress_bar.progress(100)
-                    final_output = orchestrator._generate_final_output()
-                    
-                    st.session_state['final_output'] = final_output
-                    st.session_state['processing_complete'] = True
-                    
-                    status.success("✓ Processing complete!")
-                    
-                except Exception as e:
-                    st.error(f"Error processing meeting: {str(e)}")
-                    st.exception(e)
-    
-    with tab3:
-        st.header("Results")
-        
-        if 'processing_complete' not in st.session_state or not st.session_state['processing_complete']:
-            st.info("Run the agent to see results")
-            return
-        
-        final_output = st.session_state['final_output']
-        
-        # Summary metrics
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Action Items", len(final_output.action_items))
-        
-        with col2:
-            st.metric("Decisions", len(final_output.decisions))
-        
-        with col3:
-            st.metric("Risks", len(final_output.risks))
-        
-        with col4:
-            needs_review = sum(1 for a in final_output.action_items if a.needs_review)
-            st.metric("Needs Review", needs_review)
-        
-        st.divider()
-        
-        # Action Items
-        st.subheader("📋 Action Items")
-        
-        for action in final_output.action_items:
-            with st.expander(f"{action.id}: {action.description}"):
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.write("**Owner:**", action.owner_name or "Unassigned")
-                    st.write("**Email:**", action.owner_email or "N/A")
-                    st.write("**Role:**", action.owner_role or "N/A")
-                
-                with col2:
-                    st.write("**Deadline Text:**", action.deadline_text or "None")
-                    st.write("**Deadline Date:**", str(action.deadline_date) if action.deadline_date else "Not resolved")
-                    if action.confidence:
-                        st.write("**Confidence:**", f"{action.confidence:.2%}")
-                
-                if action.needs_review:
-                    st.warning("⚠️ **Needs Review:** " + ", ".join(action.validation_notes))
-                
-                if action.evidence:
-                    st.write("**Evidence:**")
-                    for evidence in action.evidence:
-                        st.text(evidence)
-        
-        st.divider()
-        
-        # Decisions
-        st.subheader("✅ Decisions")
-        
-        for decision in final_output.decisions:
-            with st.expander(f"{decision.id}: {decision.description}"):
-                if decision.made_by:
-                    st.write("**Made by:**", decision.made_by)
-                if decision.evidence:
-                    st.write("**Evidence:**")
-                    for evidence in decision.evidence:
-                        st.text(evidence)
-        
-        st.divider()
-        
-        # Risks
-        st.subheader("⚠️ Risks & Open Questions")
-        
-        for risk in final_output.risks:
-            with st.expander(f"{risk.id}: {risk.description}"):
-                st.write("**Category:**", risk.category)
-                if risk.mentioned_by:
-                    st.write("**Mentioned by:**", risk.mentioned_by)
-                if risk.evidence:
-                    st.write("**Evidence:**")
-                    for evidence in risk.evidence:
-                        st.text(evidence)
-        
-        st.divider()
-        
-        # Follow-up Messages
-        st.subheader("📧 Follow-up Messages")
-        
-        for message in final_output.follow_up_messages:
-            with st.expander(f"To: {message.to_name} ({message.to_email})"):
-                st.write("**Subject:**", message.subject)
-                st.text_area("Body", value=message.body, height=200, disabled=True)
-                st.write(f"**Action Items:** {', '.join(message.action_items)}")
-        
-        st.divider()
-        
-        # Email Triggers
-        st.subheader("📤 Email Triggers (Simulated)")
-        
-        for trigger in final_output.email_triggers:
-            st.info(f"**[{trigger.status.upper()}]** To: {trigger.to_name} <{trigger.to}> | Subject: {trigger.subject} | Triggered: {trigger.triggered_at.strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        st.divider()
-        
-        # Download outputs
-        st.subheader("💾 Download Outputs")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # JSON download
-            json_output = json.dumps({
-                "action_items": [a.model_dump(mode='json') for a in final_output.action_items],
-                "decisions": [d.model_dump(mode='json') for d in final_output.decisions],
-                "risks": [r.model_dump(mode='json') for r in final_output.risks],
-                "follow_up_messages": [m.model_dump(mode='json') for m in final_output.follow_up_messages],
-                "metadata": final_output.metadata
-            }, indent=2, default=str)
-            
-            st.download_button(
-                label="📥 Download JSON",
-                data=json_output,
-                file_name="meeting_output.json",
-                mime="application/json"
-            )
-        
-        with col2:
-            # Summary download
-            st.download_button(
-                label="📥 Download Summary",
-                data=final_output.meeting_summary,
-                file_name="meeting_summary.txt",
-                mime="text/plain"
-            )
-
-
-if __name__ == "__main__":
-    main()
+"""
+Streamlit UI for Meeting Agent
+Interactive interface to run the agent and view results
+"""
+import streamlit as st
+import hashlib
+import importlib.util
+import json
+import orjson
+import os
+import pandas as pd
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Optional
+from pydantic import TypeAdapter
+from models import ActionItem, Decision, FinalOutput, FollowUpMessage, PeopleDirectoryIndex, Risk
+import config
+
+
+# serialization adapters built once at import - each one compiles its
+# schema a single time and is reused across Streamlit reruns
+_ACTION_ADAPTER = TypeAdapter(list[ActionItem])
+_DECISION_ADAPTER = TypeAdapter(list[Decision])
+_RISK_ADAPTER = TypeAdapter(list[Risk])
+_MESSAGE_ADAPTER = TypeAdapter(list[FollowUpMessage])
+
+
+@dataclass(slots=True)
+class UIState:
+    """
+    Typed container for everything we keep in st.session_state
+
+    One tracked session key with attribute access instead of scattered
+    string-keyed dict lookups throughout main().
+    """
+    transcript: str = ""
+    people_data: Optional[dict] = None
+    people_index: Optional[PeopleDirectoryIndex] = None
+    final_output: Optional[FinalOutput] = None
+    processing_complete: bool = False
+
+
+def lazy_import(name: str):
+    """
+    Import a module lazily - it loads on first attribute access
+
+    The orchestrator transitively pulls in requests/tenacity/loguru and
+    the stage modules, which slows down Streamlit's first paint. Loading
+    it lazily defers that cost until the Run button is actually clicked.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+orchestrator_mod = lazy_import('orchestrator')
+
+
+# cache of complete pipeline runs keyed by input hash - pressing "Run Agent"
+# twice on the same inputs should not pay for six LLM round-trips again
+RUN_CACHE_DIR = os.path.join(config.OUTPUT_DIRECTORY, ".run_cache")
+
+
+def run_cache_key(transcript: str, people_data: dict, reference_date) -> str:
+    """Build a cache key covering everything that affects the output"""
+    payload = (
+        transcript.encode('utf-8')
+        + json.dumps(people_data, sort_keys=True).encode('utf-8')
+        + str(reference_date).encode('utf-8')
+        + config.OPENROUTER_MODEL.encode('utf-8')
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+def load_cached_run(key: str):
+    """Return a cached FinalOutput for this key, or None"""
+    cache_file = os.path.join(RUN_CACHE_DIR, f"{key}.json")
+    if not os.path.exists(cache_file):
+        return None
+
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return FinalOutput.model_validate(json.load(f))
+    except Exception:
+        # corrupt/stale cache entry - just re-run the pipeline
+        return None
+
+
+def save_cached_run(key: str, final_output: FinalOutput):
+    """Store a completed run in the cache"""
+    os.makedirs(RUN_CACHE_DIR, exist_ok=True)
+    cache_file = os.path.join(RUN_CACHE_DIR, f"{key}.json")
+    atomic_write(cache_file, json.dumps(final_output.model_dump(mode='json')))
+
+
+def atomic_write(path: str, data):
+    """
+    Write a file atomically
+
+    Writes to a temp sibling first and then os.replace()s it into place,
+    so readers never observe a partially written file.
+    """
+    tmp_path = f"{path}.tmp"
+    if isinstance(data, bytes):
+        Path(tmp_path).write_bytes(data)
+    else:
+        Path(tmp_path).write_text(data, encoding='utf-8')
+    os.replace(tmp_path, path)
+
+
+@st.cache_data(show_spinner=False)
+def load_sample_transcripts():
+    """Load available sample transcripts"""
+    transcript_dir = "data"
+    if not os.path.exists(transcript_dir):
+        return {}
+
+    # scandir reuses the directory entry's cached file type (no extra
+    # stat per file), and the reads are overlapped across threads
+    with os.scandir(transcript_dir) as entries:
+        files = [
+            entry for entry in entries
+            if entry.is_file() and entry.name.endswith('.txt')
+        ]
+
+    if not files:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        contents = executor.map(
+            lambda entry: Path(entry.path).read_text(encoding='utf-8'),
+            files
+        )
+        return dict(zip((entry.name for entry in files), contents))
+
+
+@st.cache_data(show_spinner=False)
+def load_people_json(path: str, mtime: float) -> dict:
+    """
+    Load and parse a people.json file
+
+    The mtime argument is part of the cache key so the cache invalidates
+    when the file changes on disk.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    st.set_page_config(
+        page_title="Meeting Agent",
+        page_icon="🤖",
+        layout="wide"
+    )
+    
+    # single typed session object instead of scattered string keys
+    if 's' not in st.session_state:
+        st.session_state['s'] = UIState()
+    s = st.session_state['s']
+
+    st.title("🤖 AI Meeting Agent")
+    st.markdown("Transform meeting transcripts into actionable outputs")
+    
+    # Sidebar - Configuration
+    st.sidebar.header("⚙️ Configuration")
+    
+    # Check API key
+    try:
+        config.validate_config()
+        st.sidebar.success("✓ OpenAI API Key configured")
+    except ValueError as e:
+        st.sidebar.error(f"❌ {str(e)}")
+        st.error("Please configure your OpenAI API key in the .env file")
+        st.stop()
+    
+    # Reference date
+    reference_date = st.sidebar.date_input(
+        "Reference Date",
+        value=config.REFERENCE_DATE,
+        help="Date used for resolving relative deadlines like 'next Friday'"
+    )
+    
+    # Main content
+    tab1, tab2, tab3 = st.tabs(["📝 Input", "🚀 Process", "📊 Results"])
+    
+    with tab1:
+        st.header("Input Meeting Data")
+        
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            st.subheader("Meeting Transcript")
+            
+            # Load sample transcripts
+            samples = load_sample_transcripts()
+            
+            if samples:
+                sample_choice = st.selectbox(
+                    "Load sample transcript",
+                    ["Custom"] + list(samples.keys())
+                )
+                
+                if sample_choice != "Custom":
+                    transcript = samples[sample_choice]
+                else:
+                    transcript = ""
+            else:
+                transcript = ""
+            
+            transcript_input = st.text_area(
+                "Paste meeting transcript here",
+                value=transcript,
+                height=400,
+                help="Timestamped meeting transcript with speaker names"
+            )
+            
+            s.transcript = transcript_input
+        
+        with col2:
+            st.subheader("People Directory")
+            
+            people_file = st.file_uploader(
+                "Upload people.json",
+                type=['json'],
+                help="JSON file with names, roles, and emails"
+            )
+            
+            if people_file:
+                # getvalue() hands orjson the raw bytes - no extra decode
+                people_data = orjson.loads(people_file.getvalue())
+                s.people_data = people_data
+                s.people_index = PeopleDirectoryIndex.from_dict(people_data)
+                st.success(f"✓ Loaded {len(people_data)} people")
+                
+                with st.expander("View people directory"):
+                    st.json(people_data)
+            
+            elif os.path.exists(config.PEOPLE_DIRECTORY_PATH):
+                people_data = load_people_json(
+                    config.PEOPLE_DIRECTORY_PATH,
+                    os.path.getmtime(config.PEOPLE_DIRECTORY_PATH)
+                )
+                s.people_data = people_data
+                s.people_index = PeopleDirectoryIndex.from_dict(people_data)
+                st.info(f"Using default people.json ({len(people_data)} people)")
+            else:
+                st.warning("No people directory loaded")
+    
+    with tab2:
+        st.header("Process Meeting")
+        
+        if st.button("🚀 Run Agent", type="primary", use_container_width=True):
+            
+            if not s.transcript:
+                st.error("Please provide a meeting transcript")
+                return
+            
+            if s.people_data is None:
+                st.error("Please provide a people directory")
+                return
+
+            # Check the run cache - identical inputs skip the pipeline
+            cache_key = run_cache_key(
+                s.transcript,
+                s.people_data,
+                reference_date
+            )
+            cached_output = load_cached_run(cache_key)
+            if cached_output:
+                s.final_output = cached_output
+                s.processing_complete = True
+                st.success("✓ Loaded cached results for this transcript (no LLM calls needed)")
+                return
+
+            # Run orchestrator - st.status streams per-stage results as
+            # they land instead of freezing behind a single spinner
+            with st.status("Processing meeting transcript...", expanded=True) as run_status:
+                try:
+                    # inputs are already in memory - no temp-file round-trip
+                    orchestrator = orchestrator_mod.MeetingAgentOrchestrator(
+                        transcript=s.transcript,
+                        people_directory=s.people_data,
+                        reference_date=reference_date
+                    )
+
+                    # Show progress
+                    progress_bar = st.progress(0)
+
+                    if len(s.transcript) < config.FAST_PATH_THRESHOLD_CHARS:
+                        # short transcript: one fused LLM call replaces
+                        # the whole stage ladder
+                        from fast_path import extract_everything
+                        from stages.stage6_email_simulator import simulate_email_triggers
+
+                        run_status.update(label="Fast path: analyzing in a single LLM call...")
+                        progress_bar.progress(30)
+                        orchestrator.state = extract_everything(orchestrator.state)
+                        st.write(
+                            f"Fast path: {len(orchestrator.state.action_items)} actions, "
+                            f"{len(orchestrator.state.decisions)} decisions, "
+                            f"{len(orchestrator.state.risks)} risks"
+                        )
+                        progress_bar.progress(90)
+                        orchestrator.state = simulate_email_triggers(orchestrator.state)
+
+                        run_status.update(label="Generating final output...")
+                        progress_bar.progress(100)
+                        final_output = orchestrator._generate_final_output()
+
+                        s.final_output = final_output
+                        s.processing_complete = True
+                        save_cached_run(cache_key, final_output)
+
+                        run_status.update(label="✓ Processing complete!", state="complete")
+                        return
+
+                    # Import all stage functions at the start
+                    from stages.stage1_extraction import extract_intelligence
+                    from stages.stage23_combined import resolve_owners_and_deadlines
+                    from stages.stage4_validation_agent import validate_state
+                    from stages.stage5_message_generator import generate_messages
+                    from stages.stage6_email_simulator import simulate_email_triggers
+
+                    run_status.update(label="Stage 1: Extracting intelligence...")
+                    progress_bar.progress(16)
+                    orchestrator.state = extract_intelligence(orchestrator.state)
+                    st.write(
+                        f"Stage 1: {len(orchestrator.state.action_items)} actions, "
+                        f"{len(orchestrator.state.decisions)} decisions, "
+                        f"{len(orchestrator.state.risks)} risks"
+                    )
+
+                    # Stages 2+3 are fused: one combined LLM call resolves
+                    # whatever the deterministic passes missed
+                    run_status.update(label="Stages 2+3: Resolving owners and deadlines...")
+                    progress_bar.progress(33)
+                    orchestrator.state = resolve_owners_and_deadlines(orchestrator.state)
+
+                    progress_bar.progress(50)
+                    resolved = sum(1 for a in orchestrator.state.action_items if a.owner_email)
+                    dated = sum(1 for a in orchestrator.state.action_items if a.deadline_date)
+                    st.write(f"Stages 2+3: {resolved} owners and {dated} deadlines resolved")
+
+                    run_status.update(label="Stage 4: Running validation...")
+                    progress_bar.progress(66)
+                    orchestrator.state = validate_state(orchestrator.state)
+                    review = sum(1 for a in orchestrator.state.action_items if a.needs_review)
+                    st.write(f"Stage 4: {review} items flagged for review")
+
+                    run_status.update(label="Stage 5: Generating messages...")
+                    progress_bar.progress(83)
+                    orchestrator.state = generate_messages(orchestrator.state)
+                    st.write(f"Stage 5: {len(orchestrator.state.follow_up_messages)} follow-up messages")
+
+                    run_status.update(label="Stage 6: Simulating emails...")
+                    progress_bar.progress(95)
+                    orchestrator.state = simulate_email_triggers(orchestrator.state)
+
+                    run_status.update(label="Generating final output...")
+                    progress_bar.progress(100)
+                    final_output = orchestrator._generate_final_output()
+
+                    s.final_output = final_output
+                    s.processing_complete = True
+                    save_cached_run(cache_key, final_output)
+
+                    run_status.update(label="✓ Processing complete!", state="complete")
+
+                except Exception as e:
+                    run_status.update(label="Processing failed", state="error")
+                    st.error(f"Error processing meeting: {str(e)}")
+                    st.exception(e)
+    
+    with tab3:
+        st.header("Results")
+        
+        if not s.processing_complete:
+            st.info("Run the agent to see results")
+            return
+        
+        final_output = s.final_output
+        
+        # Summary metrics
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("Action Items", len(final_output.action_items))
+        
+        with col2:
+            st.metric("Decisions", len(final_output.decisions))
+        
+        with col3:
+            st.metric("Risks", len(final_output.risks))
+        
+        with col4:
+            needs_review = sum(a.needs_review for a in final_output.action_items)
+            st.metric("Needs Review", needs_review)
+        
+        st.divider()
+        
+        # Action Items - one dataframe instead of one expander widget per
+        # item, which gets slow for meetings with many actions
+        st.subheader("📋 Action Items")
+
+        if final_output.action_items:
+            action_df = pd.DataFrame([
+                {
+                    "ID": a.id,
+                    "Description": a.description,
+                    "Owner": a.owner_name or "Unassigned",
+                    "Email": a.owner_email or "N/A",
+                    "Deadline": str(a.deadline_date) if a.deadline_date else (a.deadline_text or "None"),
+                    "Confidence": a.confidence,
+                    "Needs Review": a.needs_review,
+                    "Notes": "; ".join(a.validation_notes)
+                }
+                for a in final_output.action_items
+            ])
+            st.dataframe(action_df, use_container_width=True, hide_index=True)
+
+            with st.expander("View evidence"):
+                for action in final_output.action_items:
+                    if action.evidence:
+                        st.write(f"**{action.id}:**")
+                        for evidence in action.evidence:
+                            st.text(evidence)
+
+        st.divider()
+
+        # Decisions
+        st.subheader("✅ Decisions")
+
+        if final_output.decisions:
+            decision_df = pd.DataFrame([
+                {
+                    "ID": d.id,
+                    "Description": d.description,
+                    "Made By": d.made_by or "N/A",
+                    "Evidence": " | ".join(d.evidence)
+                }
+                for d in final_output.decisions
+            ])
+            st.dataframe(decision_df, use_container_width=True, hide_index=True)
+
+        st.divider()
+
+        # Risks
+        st.subheader("⚠️ Risks & Open Questions")
+
+        if final_output.risks:
+            risk_df = pd.DataFrame([
+                {
+                    "ID": r.id,
+                    "Description": r.description,
+                    "Category": r.category,
+                    "Mentioned By": r.mentioned_by or "N/A",
+                    "Evidence": " | ".join(r.evidence)
+                }
+                for r in final_output.risks
+            ])
+            st.dataframe(risk_df, use_container_width=True, hide_index=True)
+
+        st.divider()
+        
+        # Follow-up Messages
+        st.subheader("📧 Follow-up Messages")
+        
+        for message in final_output.follow_up_messages:
+            with st.expander(f"To: {message.to_name} ({message.to_email})"):
+                st.write("**Subject:**", message.subject)
+                st.text_area("Body", value=message.body, height=200, disabled=True)
+                st.write(f"**Action Items:** {', '.join(message.action_items)}")
+        
+        st.divider()
+        
+        # Email Triggers
+        st.subheader("📤 Email Triggers (Simulated)")
+        
+        for trigger in final_output.email_triggers:
+            # isoformat is a C fast path; strftime runs a format interpreter
+            st.info(f"**[{trigger.status.upper()}]** To: {trigger.to_name} <{trigger.to}> | Subject: {trigger.subject} | Triggered: {trigger.triggered_at.isoformat(sep=' ', timespec='seconds')}")
+        
+        st.divider()
+        
+        # Download outputs
+        st.subheader("💾 Download Outputs")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # JSON download - orjson emits bytes directly, which
+            # st.download_button accepts without a re-encode
+            json_output = orjson.dumps({
+                "action_items": _ACTION_ADAPTER.dump_python(final_output.action_items, mode='json'),
+                "decisions": _DECISION_ADAPTER.dump_python(final_output.decisions, mode='json'),
+                "risks": _RISK_ADAPTER.dump_python(final_output.risks, mode='json'),
+                "follow_up_messages": _MESSAGE_ADAPTER.dump_python(final_output.follow_up_messages, mode='json'),
+                "metadata": final_output.metadata
+            }, option=orjson.OPT_INDENT_2)
+
+            st.download_button(
+                label="📥 Download JSON",
+                data=json_output,
+                file_name="meeting_output.json",
+                mime="application/json"
+            )
+        
+        with col2:
+            # Summary download
+            st.download_button(
+                label="📥 Download Summary",
+                data=final_output.meeting_summary,
+                file_name="meeting_summary.txt",
+                mime="text/plain"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 """Config settings for the meeting agent"""
 import os
-from datetime import datetime
+from datetime import date
 from dotenv import load_dotenv
 from loguru import logger
 
@@ -13,11 +13,14 @@ OPENROUTER_MODEL = "openai/gpt-4o-mini"  # using openrouter for access
 
 # reference date for deadline resolution
 ref_date_str = os.getenv("REFERENCE_DATE", "2026-01-10")
-REFERENCE_DATE = datetime.strptime(ref_date_str, "%Y-%m-%d").date()
+REFERENCE_DATE = date.fromisoformat(ref_date_str)  # C fast path, same format
 
 # file paths
 PEOPLE_DIRECTORY_PATH = "data/people.json"
 OUTPUT_DIRECTORY = "outputs"
+LLM_CACHE_DIR = os.path.join(OUTPUT_DIRECTORY, ".llm_cache")  # cached LLM responses
+LLM_CACHE_TTL_SECONDS = 7 * 86400  # entries older than a week are stale
+LLM_CACHE_MAX_ENTRIES = 1024  # on-disk entry cap, oldest evicted first
 
 # LLM settings
 LLM_TEMPERATURE = 0.1  # low temp = more deterministic
@@ -27,6 +30,14 @@ LLM_MAX_TOKENS = 4000  # TODO: might need to increase this for longer meetings
 CONFIDENCE_THRESHOLD = 0.7  # flag anything below 70%
 MAX_RETRIES = 3
 
+# concurrency cap for parallel LLM calls (stage 5 fans out per owner)
+MAX_CONCURRENCY = 4
+
+# transcripts shorter than this go through the single-call fast path
+# instead of the six-stage ladder (per-stage prompts win on accuracy
+# only for long meetings)
+FAST_PATH_THRESHOLD_CHARS = 6000
+
 def validate_config():
     # check if api key is set
     if not OPENROUTER_API_KEY or OPENROUTER_API_KEY == "your_openrouter_api_key_here":
@@ -0,0 +1,211 @@
+"""
+Fast path: fuse the per-stage LLM calls into one structured call
+
+For short transcripts the focused per-stage prompts add little accuracy
+but each pays a full network round-trip. This module extracts actions,
+decisions, risks, owners, deadlines and follow-up drafts in a single
+LLM call; the orchestrator's local machinery (email simulation, output
+export) still runs afterwards.
+"""
+from datetime import date
+from loguru import logger
+from models import MeetingState, ActionItem, Decision, Risk, FollowUpMessage
+import config
+from utils import call_openai_with_retry, parse_json_safely, truncate_text
+
+
+# static instructions live in a module constant built once at import;
+# only the directory, date and transcript vary per call, and they come
+# last so the cacheable prompt prefix stays byte-identical
+_FAST_PATH_PREAMBLE = """You are analyzing a meeting transcript. Your job, in ONE pass:
+1. **ACTION ITEMS** - tasks someone needs to complete. Match each owner to a
+   person from the directory (use the exact directory name) and convert any
+   deadline phrase to an ISO date (YYYY-MM-DD) relative to today.
+2. **DECISIONS** - important choices that were made.
+3. **RISKS & QUESTIONS** - concerns or unresolved issues.
+4. **FOLLOW-UP MESSAGES** - one short professional email per owner listing
+   their action items and deadlines (under 200 words).
+
+Always include evidence: direct quotes with timestamps from the meeting.
+
+Respond with ONLY valid JSON in this format:
+{
+  "action_items": [
+    {
+      "description": "Clear description of the task",
+      "owner_name": "Exact directory name or null",
+      "deadline_text": "deadline phrase or null",
+      "deadline_date": "YYYY-MM-DD or null",
+      "confidence": 0.95,
+      "evidence": ["[HH:MM] Speaker: exact quote"]
+    }
+  ],
+  "decisions": [
+    {
+      "description": "What was decided",
+      "made_by": "Person Name or null",
+      "evidence": ["[HH:MM] Speaker: exact quote"],
+      "timestamp": "[HH:MM]"
+    }
+  ],
+  "risks": [
+    {
+      "description": "The risk or question",
+      "category": "risk or open_question",
+      "mentioned_by": "Person Name or null",
+      "evidence": ["[HH:MM] Speaker: exact quote"],
+      "timestamp": "[HH:MM]"
+    }
+  ],
+  "follow_up_messages": [
+    {
+      "owner_name": "Exact directory name",
+      "subject": "Email subject line",
+      "body": "Email body text"
+    }
+  ]
+}
+
+People Directory:
+"""
+
+
+def create_fast_path_prompt(state: MeetingState) -> str:
+    # static preamble first, dynamic parts appended (no f-string rebuild
+    # of the big template per call)
+    return (
+        f"{_FAST_PATH_PREAMBLE}{state.people_directory_prompt}\n\n"
+        f"Today is {state.reference_date}.\n\n"
+        f"Here's the meeting:\n{state.transcript}"
+    )
+
+
+def extract_everything(state: MeetingState) -> MeetingState:
+    """Run the whole analysis in one LLM call (for short transcripts)"""
+    logger.info("Fast path: single-call extraction...")
+
+    resp = call_openai_with_retry(
+        prompt=create_fast_path_prompt(state),
+        system_message="You are an expert meeting analyst. Extract information accurately, provide evidence, and output only valid JSON."
+    )
+
+    result = parse_json_safely(resp, fallback={
+        "action_items": [],
+        "decisions": [],
+        "risks": [],
+        "follow_up_messages": []
+    })
+
+    # convert action items, resolving owners against the directory
+    action_items = []
+    for idx, item in enumerate(result.get("action_items", [])):
+        try:
+            evidence = item.get("evidence", [])
+            action = ActionItem(
+                id=f"action_{idx+1}",
+                description=item["description"],
+                owner_name=item.get("owner_name"),
+                deadline_text=item.get("deadline_text"),
+                evidence=evidence,
+                evidence_preview=[truncate_text(e, 200) for e in evidence[:2]],
+                confidence=item.get("confidence")
+            )
+
+            person = state.people_directory.get(action.owner_name) if action.owner_name else None
+            if person:
+                action.owner_email = person.email
+                action.owner_role = person.role
+            elif action.owner_name:
+                action.needs_review = True
+                action.validation_notes.append("Owner could not be resolved")
+
+            date_str = item.get("deadline_date")
+            if date_str:
+                try:
+                    action.deadline_date = date.fromisoformat(date_str)
+                except ValueError:
+                    pass  # fall through to the review flag below
+
+            if action.deadline_text and not action.deadline_date:
+                action.needs_review = True
+                action.validation_notes.append(
+                    f"Could not resolve deadline: '{action.deadline_text}'"
+                )
+
+            action_items.append(action)
+        except Exception as e:
+            logger.warning(f"Skipped malformed action item: {e}")
+            continue
+
+    state.action_items = action_items
+
+    # decisions and risks
+    decisions = []
+    for idx, item in enumerate(result.get("decisions", [])):
+        try:
+            decisions.append(Decision(
+                id=f"decision_{idx+1}",
+                description=item["description"],
+                made_by=item.get("made_by"),
+                evidence=item.get("evidence", []),
+                timestamp=item.get("timestamp")
+            ))
+        except Exception as e:
+            logger.warning(f"Skipped malformed decision: {e}")
+            continue
+    state.decisions = decisions
+
+    risks = []
+    for idx, item in enumerate(result.get("risks", [])):
+        try:
+            risks.append(Risk(
+                id=f"risk_{idx+1}",
+                description=item["description"],
+                category=item.get("category", "risk"),
+                mentioned_by=item.get("mentioned_by"),
+                evidence=item.get("evidence", []),
+                timestamp=item.get("timestamp")
+            ))
+        except Exception as e:
+            logger.warning(f"Skipped malformed risk: {e}")
+            continue
+    state.risks = risks
+
+    # follow-up messages - only keep ones addressed to known owners
+    actions_by_owner = {}
+    for action in state.action_items:
+        if action.owner_name and action.owner_email:
+            actions_by_owner.setdefault(action.owner_name, []).append(action)
+
+    messages = []
+    for item in result.get("follow_up_messages", []):
+        owner_name = item.get("owner_name")
+        owned = actions_by_owner.get(owner_name)
+        if not owned:
+            continue
+        try:
+            messages.append(FollowUpMessage(
+                to_email=owned[0].owner_email,
+                to_name=owner_name,
+                subject=item.get("subject", "Follow-up: Your Action Items"),
+                body=item.get("body", ""),
+                action_items=[a.id for a in owned]
+            ))
+        except Exception as e:
+            logger.warning(f"Skipped malformed follow-up message: {e}")
+            continue
+    state.follow_up_messages = messages
+
+    logger.success(
+        f"Fast path: {len(state.action_items)} actions, "
+        f"{len(state.decisions)} decisions, {len(state.risks)} risks, "
+        f"{len(state.follow_up_messages)} messages in one call"
+    )
+
+    state.stage_completed = "message_generation"
+    state.processing_notes.append(
+        f"Fast path: extracted everything in a single LLM call "
+        f"({len(state.action_items)} actions)"
+    )
+
+    return state
@@ -1,134 +1,276 @@
-"""
-📊 Data Models - The Building Blocks of Our Agent
-
-Think of these as "containers" that hold information in a structured way.
-Like filling out a form with specific fields for each piece of information.
-"""
-from typing import List, Optional, Dict, Any
-from datetime import date, datetime
-from pydantic import BaseModel, Field
-
-
-class ActionItem(BaseModel):
-    """
-    📝 A single task someone needs to complete
-    
-    Example: "Emily needs to finalize the signup copy by Friday"
-    """
-    id: str  # Unique identifier like "action_1"
-    description: str  # What needs to be done
-    
-    # 👤 Who owns this task?
-    owner_name: Optional[str] = None  # e.g., "Emily Carter"
-    owner_email: Optional[str] = None  # e.g., "emily.carter@example.com"
-    owner_role: Optional[str] = None  # e.g., "Product Designer"
-    
-    # ⏰ When is it due?
-    deadline_text: Optional[str] = None  # Original phrase like "next Friday"
-    deadline_date: Optional[date] = None  # Actual date like 2026-01-17
-    
-    # 📌 Proof from the meeting
-    evidence: List[str] = Field(default_factory=list)  # Direct quotes
-    
-    # 🎯 Quality control
-    confidence: Optional[float] = None  # How sure are we? (0.0 to 1.0)
-    needs_review: bool = False  # Should a human double-check this?
-    validation_notes: List[str] = Field(default_factory=list)  # Any issues found
-
-
-class Decision(BaseModel):
-    """
-    ✅ An important decision made during the meeting
-    
-    Example: "Team decided to remove the legacy signup flow"
-    """
-    id: str  # Unique identifier
-    description: str  # What was decided
-    made_by: Optional[str] = None  # Who made the call
-    evidence: List[str] = Field(default_factory=list)  # Quotes from meeting
-    timestamp: Optional[str] = None  # When it was decided
-
-
-class Risk(BaseModel):
-    """
-    ⚠️ A concern or question that was raised
-    
-    Example: "Too many dependencies might delay the demo"
-    """
-    id: str  # Unique identifier
-    description: str  # What's the risk or question
-    category: str  # Is it a "risk" or "open_question"?
-    mentioned_by: Optional[str] = None  # Who brought it up
-    evidence: List[str] = Field(default_factory=list)  # Quotes
-    timestamp: Optional[str] = None  # When mentioned
-
-
-class Person(BaseModel):
-    """
-    👤 A team member from the people directory
-    """
-    name: str  # Full name
-    email: str  # Email address
-    role: str  # Job title
-
-
-class FollowUpMessage(BaseModel):
-    """
-    📧 A draft email to send to someone about their tasks
-    """
-    to_email: str  # Who gets this email
-    to_name: str  # Their name
-    subject: str  # Email subject line
-    body: str  # The actual message
-    action_items: List[str] = Field(default_factory=list)  # Which tasks it covers
-
-
-class EmailTrigger(BaseModel):
-    """
-    📤 A record of an email we would send (but we're just simulating)
-    """
-    to: str  # Recipient email
-    to_name: str  # Recipient name
-    subject: str  # Email subject
-    body: str  # Email content
-    triggered_at: datetime  # When we "sent" it
-    status: str = "simulated"  # Always "simulated" since we don't really send
-
-
-class MeetingState(BaseModel):
-    """
-    🗂️ The "clipboard" that travels through each stage
-    
-    As each stage completes, it adds its results here.
-    Think of it like a form being passed from desk to desk,
-    with each person filling in their section.
-    """
-    transcript: str  # The meeting conversation
-    people_directory: Dict[str, Person]  # Who's on the team
-    reference_date: date  # What day to use as "today"
-    
-    # 📋 What we've extracted so far
-    action_items: List[ActionItem] = Field(default_factory=list)
-    decisions: List[Decision] = Field(default_factory=list)
-    risks: List[Risk] = Field(default_factory=list)
-    
-    # 📧 Generated outputs
-    follow_up_messages: List[FollowUpMessage] = Field(default_factory=list)
-    email_triggers: List[EmailTrigger] = Field(default_factory=list)
-    
-    # 📊 Progress tracking
-    stage_completed: str = "none"  # Which stage just finished
-    processing_notes: List[str] = Field(default_factory=list)  # Log of what happened
-
-
-class FinalOutput(BaseModel):
-    """
-    🎁 The final gift-wrapped results for the user
-    """
-    meeting_summary: str  # Human-readable overview
-    action_items: List[ActionItem]  # All the tasks
-    decisions: List[Decision]  # All the decisions
-    risks: List[Risk]  # All the concerns
-    follow_up_messages: List[FollowUpMessage]  # Draft emails
-    email_triggers: List[EmailTrigger]  # Email simulation records
-    metadata: Dict[str, Any] = Field(default_factory=dict)  # Extra info
+"""
+📊 Data Models - The Building Blocks of Our Agent
+
+Think of these as "containers" that hold information in a structured way.
+Like filling out a form with specific fields for each piece of information.
+"""
+import sys
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import List, Optional, Dict, Any
+from datetime import date, datetime
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+
+
+class ActionItem(BaseModel):
+    """
+    📝 A single task someone needs to complete
+    
+    Example: "Emily needs to finalize the signup copy by Friday"
+    """
+    model_config = ConfigDict(extra='forbid')
+
+    id: str  # Unique identifier like "action_1"
+    description: str  # What needs to be done
+    
+    # 👤 Who owns this task?
+    owner_name: Optional[str] = None  # e.g., "Emily Carter"
+    owner_email: Optional[str] = None  # e.g., "emily.carter@example.com"
+    owner_role: Optional[str] = None  # e.g., "Product Designer"
+    
+    # ⏰ When is it due?
+    deadline_text: Optional[str] = None  # Original phrase like "next Friday"
+    deadline_date: Optional[date] = None  # Actual date like 2026-01-17
+    
+    # 📌 Proof from the meeting
+    evidence: List[str] = Field(default_factory=list)  # Direct quotes
+    # Truncated quotes for LLM prompts (set once at extraction time so
+    # later stages don't re-slice and long quotes don't bloat tokens)
+    evidence_preview: List[str] = Field(default_factory=list)
+    
+    # 🎯 Quality control
+    confidence: Optional[float] = None  # How sure are we? (0.0 to 1.0)
+    needs_review: bool = False  # Should a human double-check this?
+    validation_notes: List[str] = Field(default_factory=list)  # Any issues found
+
+    # lazily-cached lowercased description (private, stays out of dumps)
+    _description_lower: Optional[str] = PrivateAttr(default=None)
+
+    # set sidecar mirroring validation_notes for O(1) dedup; the list
+    # stays authoritative and keeps display order
+    _notes_set: set = PrivateAttr(default_factory=set)
+
+    def add_note(self, note: str):
+        """Append a validation note unless it's already recorded"""
+        if len(self._notes_set) != len(self.validation_notes):
+            # re-sync after direct appends to validation_notes
+            self._notes_set = set(self.validation_notes)
+        if note not in self._notes_set:
+            self._notes_set.add(note)
+            self.validation_notes.append(note)
+
+    @property
+    def description_lower(self) -> str:
+        """Lowercased description, computed once per item"""
+        if self._description_lower is None:
+            self._description_lower = self.description.lower()
+        return self._description_lower
+
+    @field_validator('owner_role', mode='after')
+    @classmethod
+    def _intern(cls, v):
+        # these fields come from a small fixed vocabulary - intern them so
+        # repeated values share one str object (pointer-compare equality)
+        return sys.intern(v) if isinstance(v, str) else v
+
+
+class Decision(BaseModel):
+    """
+    ✅ An important decision made during the meeting
+    
+    Example: "Team decided to remove the legacy signup flow"
+    """
+    model_config = ConfigDict(extra='forbid')
+
+    id: str  # Unique identifier
+    description: str  # What was decided
+    made_by: Optional[str] = None  # Who made the call
+    evidence: List[str] = Field(default_factory=list)  # Quotes from meeting
+    timestamp: Optional[str] = None  # When it was decided
+
+
+class Risk(BaseModel):
+    """
+    ⚠️ A concern or question that was raised
+    
+    Example: "Too many dependencies might delay the demo"
+    """
+    model_config = ConfigDict(extra='forbid')
+
+    id: str  # Unique identifier
+    description: str  # What's the risk or question
+    category: str  # Is it a "risk" or "open_question"?
+    mentioned_by: Optional[str] = None  # Who brought it up
+    evidence: List[str] = Field(default_factory=list)  # Quotes
+    timestamp: Optional[str] = None  # When mentioned
+
+    @field_validator('category', mode='after')
+    @classmethod
+    def _intern(cls, v):
+        # these fields come from a small fixed vocabulary - intern them so
+        # repeated values share one str object (pointer-compare equality)
+        return sys.intern(v) if isinstance(v, str) else v
+
+
+class Person(BaseModel):
+    """
+    👤 A team member from the people directory
+    """
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    name: str  # Full name
+    email: str  # Email address
+    role: str  # Job title
+
+    @field_validator('role', mode='after')
+    @classmethod
+    def _intern(cls, v):
+        # these fields come from a small fixed vocabulary - intern them so
+        # repeated values share one str object (pointer-compare equality)
+        return sys.intern(v) if isinstance(v, str) else v
+
+
+@dataclass(slots=True)
+class PeopleDirectoryIndex:
+    """
+    🔎 Precomputed lookup index over the people directory
+
+    Normalized full names and first names map straight to a Person, so
+    owner matching becomes a single dict lookup instead of re-scanning
+    (and re-normalizing) the whole directory for every action item.
+    """
+    names: List[str] = field(default_factory=list)
+    emails: List[str] = field(default_factory=list)
+    roles: List[str] = field(default_factory=list)
+    lookup: Dict[str, Person] = field(default_factory=dict)  # normalized name -> Person
+
+    @classmethod
+    def from_people(cls, people_directory: Dict[str, Person]) -> "PeopleDirectoryIndex":
+        """Build the index from an already-parsed directory"""
+        index = cls()
+        for name, person in people_directory.items():
+            index.names.append(name)
+            index.emails.append(person.email)
+            index.roles.append(person.role)
+            # keep the first person registered under a key, matching the
+            # old first-match-wins scan order
+            index.lookup.setdefault(name.lower().strip(), person)
+            index.lookup.setdefault(name.split()[0].lower(), person)
+        return index
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, dict]) -> "PeopleDirectoryIndex":
+        """Build the index straight from raw people.json data"""
+        people = {
+            name: Person(name=name, email=info['email'], role=info['role'])
+            for name, info in data.items()
+        }
+        return cls.from_people(people)
+
+    def find(self, owner_name: Optional[str]) -> Optional[Person]:
+        """O(1) lookup by (possibly partial) owner name"""
+        if not owner_name:
+            return None
+        return self.lookup.get(owner_name.lower().strip())
+
+
+class FollowUpMessage(BaseModel):
+    """
+    📧 A draft email to send to someone about their tasks
+    """
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    to_email: str  # Who gets this email
+    to_name: str  # Their name
+    subject: str  # Email subject line
+    body: str  # The actual message
+    action_items: List[str] = Field(default_factory=list)  # Which tasks it covers
+
+
+class EmailTrigger(BaseModel):
+    """
+    📤 A record of an email we would send (but we're just simulating)
+    """
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    to: str  # Recipient email
+    to_name: str  # Recipient name
+    subject: str  # Email subject
+    body: str  # Email content
+    triggered_at: datetime  # When we "sent" it
+    status: str = "simulated"  # Always "simulated" since we don't really send
+
+    @field_validator('status', mode='after')
+    @classmethod
+    def _intern(cls, v):
+        # these fields come from a small fixed vocabulary - intern them so
+        # repeated values share one str object (pointer-compare equality)
+        return sys.intern(v) if isinstance(v, str) else v
+
+
+class MeetingState(BaseModel):
+    """
+    🗂️ The "clipboard" that travels through each stage
+    
+    As each stage completes, it adds its results here.
+    Think of it like a form being passed from desk to desk,
+    with each person filling in their section.
+    """
+    model_config = ConfigDict(extra='forbid')
+
+    transcript: str  # The meeting conversation
+    people_directory: Dict[str, Person]  # Who's on the team
+    name_index: Optional[PeopleDirectoryIndex] = None  # Built once, O(1) owner lookups
+    reference_date: date  # What day to use as "today"
+    
+    # 📋 What we've extracted so far
+    action_items: List[ActionItem] = Field(default_factory=list)
+    decisions: List[Decision] = Field(default_factory=list)
+    risks: List[Risk] = Field(default_factory=list)
+    
+    # 📧 Generated outputs
+    follow_up_messages: List[FollowUpMessage] = Field(default_factory=list)
+    email_triggers: List[EmailTrigger] = Field(default_factory=list)
+    
+    # 📊 Progress tracking
+    stage_completed: str = "none"  # Which stage just finished
+    processing_notes: List[str] = Field(default_factory=list)  # Log of what happened
+
+    @cached_property
+    def people_directory_prompt(self) -> str:
+        """
+        Stable serialized people directory for prompts
+
+        Serialized once per run in a fixed (sorted) order so every stage
+        sends a byte-identical prefix - that lets the provider's prompt
+        cache reuse it across stage calls instead of re-billing it.
+        """
+        lines = []
+        for name in sorted(self.people_directory):
+            person = self.people_directory[name]
+            lines.append(f"- {name} ({person.role}) - {person.email}")
+        return "\n".join(lines)
+
+
+class FinalOutput(BaseModel):
+    """
+    🎁 The final gift-wrapped results for the user
+    """
+    model_config = ConfigDict(extra='forbid')
+
+    meeting_summary: str  # Human-readable overview
+    action_items: List[ActionItem]  # All the tasks
+    decisions: List[Decision]  # All the decisions
+    risks: List[Risk]  # All the concerns
+    follow_up_messages: List[FollowUpMessage]  # Draft emails
+    email_triggers: List[EmailTrigger]  # Email simulation records
+    metadata: Dict[str, Any] = Field(default_factory=dict)  # Extra info
+
+
+# ⚡ Warm up pydantic's lazily-built serializers/validators at import so
+# the first model_dump/model_validate call doesn't pay the build cost
+for _model in (ActionItem, Decision, Risk, Person, FollowUpMessage,
+               EmailTrigger, MeetingState, FinalOutput):
+    _model.__pydantic_serializer__
+    _model.__pydantic_validator__
+del _model
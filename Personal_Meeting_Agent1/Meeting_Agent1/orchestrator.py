@@ -4,18 +4,30 @@ Controls execution order and manages state flow between stages
 """
 import json
 import os
+import orjson
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict
-from models import MeetingState, Person, FinalOutput
+from loguru import logger
+from models import MeetingState, PeopleDirectoryIndex, Person, FinalOutput
 import config
 
-# Import all stages
-from stages.stage1_extraction import extract_intelligence
-from stages.stage2_owner_resolution import resolve_owners
-from stages.stage3_deadline_resolution import resolve_deadlines
-from stages.stage4_validation_agent import validate_state
-from stages.stage5_message_generator import generate_messages
-from stages.stage6_email_simulator import simulate_email_triggers, export_email_logs
+# stage modules are imported inside run_pipeline/_generate_final_output:
+# importing the orchestrator (e.g. from the Streamlit app) stays cheap
+# and each stage's dependencies load only when a pipeline actually runs
+
+
+@lru_cache(maxsize=4)
+def _load_people_cached(path: str, mtime: float) -> Dict[str, Person]:
+    """Parse people.json once per (path, mtime) - batch runs over many
+    transcripts reuse the same parsed directory"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    return {
+        name: Person(name=name, email=info['email'], role=info['role'])
+        for name, info in data.items()
+    }
 
 
 class MeetingAgentOrchestrator:
@@ -23,23 +35,34 @@ class MeetingAgentOrchestrator:
     Main orchestrator that controls the pipeline execution
     """
     
-    def __init__(self, transcript: str, people_directory_path: str, reference_date=None):
+    def __init__(self, transcript: str, people_directory_path: str = None,
+                 reference_date=None, people_directory: Dict[str, dict] = None):
         """
         Initialize orchestrator with inputs
-        
+
         Args:
             transcript: Meeting transcript text
             people_directory_path: Path to people.json
             reference_date: Reference date for deadline resolution
+            people_directory: Already-parsed people data (name -> {email, role});
+                when given, skips the people.json file read entirely
         """
         self.transcript = transcript
-        self.people_directory = self._load_people_directory(people_directory_path)
+        if people_directory is not None:
+            self.people_directory = {
+                name: Person(name=name, email=info['email'], role=info['role'])
+                for name, info in people_directory.items()
+            }
+        else:
+            self.people_directory = self._load_people_directory(people_directory_path)
         self.reference_date = reference_date or config.REFERENCE_DATE
         
-        # Initialize state
+        # Initialize state (the name index is built once here; stage 2
+        # then resolves exact owner matches with plain dict lookups)
         self.state = MeetingState(
             transcript=transcript,
             people_directory=self.people_directory,
+            name_index=PeopleDirectoryIndex.from_people(self.people_directory),
             reference_date=self.reference_date
         )
         
@@ -47,80 +70,74 @@ class MeetingAgentOrchestrator:
         os.makedirs(config.OUTPUT_DIRECTORY, exist_ok=True)
     
     def _load_people_directory(self, path: str) -> Dict[str, Person]:
-        """Load and parse people directory"""
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        people_dir = {}
-        for name, info in data.items():
-            people_dir[name] = Person(
-                name=name,
-                email=info['email'],
-                role=info['role']
-            )
-        
-        return people_dir
+        """Load and parse people directory (cached by path + mtime)"""
+        # a fresh dict per orchestrator so one run's mutations can't leak
+        # into another; the frozen Person objects themselves are shared
+        return dict(_load_people_cached(path, os.path.getmtime(path)))
     
     def run_pipeline(self) -> FinalOutput:
         """
         Execute the complete pipeline
         """
-        print("=" * 70)
-        print("MEETING AGENT PIPELINE STARTED")
-        print("=" * 70)
-        
+        from stages.stage1_extraction import extract_intelligence
+        from stages.stage23_combined import resolve_owners_and_deadlines
+        from stages.stage4_validation_agent import validate_state
+        from stages.stage5_message_generator import generate_messages
+        from stages.stage6_email_simulator import simulate_email_triggers
+
+        logger.info("MEETING AGENT PIPELINE STARTED")
+
         try:
             # Stage 1: Extract intelligence from transcript
-            print("\n[STAGE 1] Extracting intelligence from transcript...")
+            logger.info("[STAGE 1] Extracting intelligence from transcript...")
             self.state = extract_intelligence(self.state)
-            print(f"✓ Extracted {len(self.state.action_items)} actions, "
-                  f"{len(self.state.decisions)} decisions, {len(self.state.risks)} risks")
-            
-            # Stage 2: Resolve owners
-            print("\n[STAGE 2] Resolving action item owners...")
-            self.state = resolve_owners(self.state)
-            resolved_count = sum(1 for a in self.state.action_items if a.owner_email)
-            print(f"✓ Resolved {resolved_count}/{len(self.state.action_items)} owners")
-            
-            # Stage 3: Resolve deadlines
-            print("\n[STAGE 3] Resolving deadlines...")
-            self.state = resolve_deadlines(self.state)
-            deadline_count = sum(1 for a in self.state.action_items if a.deadline_date)
-            print(f"✓ Resolved {deadline_count}/{len(self.state.action_items)} deadlines")
-            
+            logger.success(f"Extracted {len(self.state.action_items)} actions, "
+                           f"{len(self.state.decisions)} decisions, {len(self.state.risks)} risks")
+
+            # Stages 2+3: fused into one stage with a single combined
+            # LLM call for everything the deterministic passes miss
+            logger.info("[STAGES 2+3] Resolving owners and deadlines...")
+            self.state = resolve_owners_and_deadlines(self.state)
+            # one pass over the actions for both counters
+            resolved_count = deadline_count = 0
+            for a in self.state.action_items:
+                resolved_count += bool(a.owner_email)
+                deadline_count += bool(a.deadline_date)
+            logger.success(f"Resolved {resolved_count}/{len(self.state.action_items)} owners")
+            logger.success(f"Resolved {deadline_count}/{len(self.state.action_items)} deadlines")
+
             # Stage 4: Validation
-            print("\n[STAGE 4] Running validation agent...")
+            logger.info("[STAGE 4] Running validation agent...")
             self.state = validate_state(self.state)
             review_count = sum(1 for a in self.state.action_items if a.needs_review)
-            print(f"✓ Validated all items, {review_count} need human review")
-            
+            logger.success(f"Validated all items, {review_count} need human review")
+
             # Stage 5: Generate follow-up messages
-            print("\n[STAGE 5] Generating follow-up messages...")
+            logger.info("[STAGE 5] Generating follow-up messages...")
             self.state = generate_messages(self.state)
-            print(f"✓ Generated {len(self.state.follow_up_messages)} messages")
-            
+            logger.success(f"Generated {len(self.state.follow_up_messages)} messages")
+
             # Stage 6: Simulate email triggers
-            print("\n[STAGE 6] Simulating email triggers...")
+            logger.info("[STAGE 6] Simulating email triggers...")
             self.state = simulate_email_triggers(self.state)
-            print(f"✓ Simulated {len(self.state.email_triggers)} email triggers")
-            
+            logger.success(f"Simulated {len(self.state.email_triggers)} email triggers")
+
             # Generate final output
-            print("\n[FINAL] Generating outputs...")
+            logger.info("[FINAL] Generating outputs...")
             final_output = self._generate_final_output()
-            
-            print("\n" + "=" * 70)
-            print("PIPELINE COMPLETED SUCCESSFULLY")
-            print("=" * 70)
-            
+
+            logger.success("PIPELINE COMPLETED SUCCESSFULLY")
+
             return final_output
-            
+
         except Exception as e:
-            print(f"\n[ERROR] Pipeline failed: {str(e)}")
+            logger.error(f"Pipeline failed: {str(e)}")
             raise
     
     def _generate_final_output(self) -> FinalOutput:
         """Generate final structured output and export files"""
-        
+        from stages.stage6_email_simulator import export_email_logs
+
         # Create summary
         summary = self._generate_summary()
         
@@ -150,113 +167,71 @@ class MeetingAgentOrchestrator:
         
         return final_output
     
-    def _generate_summary(self) -> str:
-        """Generate human-readable summary"""
-        lines = []
-        lines.append("MEETING ANALYSIS SUMMARY")
-        lines.append("=" * 60)
-        lines.append(f"Reference Date: {self.reference_date}")
-        lines.append("")
-        
+    def _summary_lines(self):
+        """Yield summary lines one at a time (streamable to disk)"""
+        yield "MEETING ANALYSIS SUMMARY"
+        yield "=" * 60
+        yield f"Reference Date: {self.reference_date}"
+        yield ""
+
         # Action Items
-        lines.append(f"ACTION ITEMS ({len(self.state.action_items)})")
-        lines.append("-" * 60)
+        yield f"ACTION ITEMS ({len(self.state.action_items)})"
+        yield "-" * 60
         for action in self.state.action_items:
-            lines.append(f"\n[{action.id}] {action.description}")
-            lines.append(f"  Owner: {action.owner_name or 'UNASSIGNED'} ({action.owner_email or 'N/A'})")
-            lines.append(f"  Deadline: {action.deadline_date or action.deadline_text or 'None'}")
+            yield f"\n[{action.id}] {action.description}"
+            yield f"  Owner: {action.owner_name or 'UNASSIGNED'} ({action.owner_email or 'N/A'})"
+            yield f"  Deadline: {action.deadline_date or action.deadline_text or 'None'}"
             if action.needs_review:
-                lines.append(f"  ⚠️  NEEDS REVIEW: {', '.join(action.validation_notes)}")
-        
+                yield f"  ⚠️  NEEDS REVIEW: {', '.join(action.validation_notes)}"
+
         # Decisions
-        lines.append(f"\n\nDECISIONS ({len(self.state.decisions)})")
-        lines.append("-" * 60)
+        yield f"\n\nDECISIONS ({len(self.state.decisions)})"
+        yield "-" * 60
         for decision in self.state.decisions:
-            lines.append(f"\n[{decision.id}] {decision.description}")
+            yield f"\n[{decision.id}] {decision.description}"
             if decision.made_by:
-                lines.append(f"  Made by: {decision.made_by}")
-        
+                yield f"  Made by: {decision.made_by}"
+
         # Risks
-        lines.append(f"\n\nRISKS & OPEN QUESTIONS ({len(self.state.risks)})")
-        lines.append("-" * 60)
+        yield f"\n\nRISKS & OPEN QUESTIONS ({len(self.state.risks)})"
+        yield "-" * 60
         for risk in self.state.risks:
-            lines.append(f"\n[{risk.id}] {risk.description}")
-            lines.append(f"  Category: {risk.category}")
+            yield f"\n[{risk.id}] {risk.description}"
+            yield f"  Category: {risk.category}"
             if risk.mentioned_by:
-                lines.append(f"  Mentioned by: {risk.mentioned_by}")
-        
-        return "\n".join(lines)
+                yield f"  Mentioned by: {risk.mentioned_by}"
+
+    def _generate_summary(self) -> str:
+        """Generate human-readable summary"""
+        return "\n".join(self._summary_lines())
     
     def _export_json(self, final_output: FinalOutput):
         """Export structured JSON output"""
         output_file = f"{config.OUTPUT_DIRECTORY}/meeting_output.json"
         
-        # Convert to dict
-        output_dict = {
-            "meeting_summary": final_output.meeting_summary,
-            "action_items": [
-                {
-                    "id": a.id,
-                    "description": a.description,
-                    "owner_name": a.owner_name,
-                    "owner_email": a.owner_email,
-                    "owner_role": a.owner_role,
-                    "deadline_text": a.deadline_text,
-                    "deadline_date": str(a.deadline_date) if a.deadline_date else None,
-                    "evidence": a.evidence,
-                    "confidence": a.confidence,
-                    "needs_review": a.needs_review,
-                    "validation_notes": a.validation_notes
-                }
-                for a in final_output.action_items
-            ],
-            "decisions": [
-                {
-                    "id": d.id,
-                    "description": d.description,
-                    "made_by": d.made_by,
-                    "evidence": d.evidence,
-                    "timestamp": d.timestamp
-                }
-                for d in final_output.decisions
-            ],
-            "risks": [
-                {
-                    "id": r.id,
-                    "description": r.description,
-                    "category": r.category,
-                    "mentioned_by": r.mentioned_by,
-                    "evidence": r.evidence,
-                    "timestamp": r.timestamp
-                }
-                for r in final_output.risks
-            ],
-            "follow_up_messages": [
-                {
-                    "to_email": m.to_email,
-                    "to_name": m.to_name,
-                    "subject": m.subject,
-                    "body": m.body,
-                    "action_items": m.action_items
-                }
-                for m in final_output.follow_up_messages
-            ],
-            "metadata": final_output.metadata
-        }
+        # pydantic's Rust serializer builds the whole tree in one pass
+        # (mode='json' turns dates/datetimes into ISO strings, same shape
+        # as the old hand-rolled comprehensions; email triggers keep going
+        # to their own log file)
+        output_dict = final_output.model_dump(mode='json', exclude={'email_triggers'})
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_dict, f, indent=2, ensure_ascii=False)
-        
-        print(f"✓ Exported JSON to: {output_file}")
+        # orjson serializes in C and emits UTF-8 bytes directly
+        # (default=str covers the date/datetime values in metadata)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(output_dict, option=orjson.OPT_INDENT_2, default=str))
+
+        logger.success(f"Exported JSON to: {output_file}")
     
     def _export_summary(self, final_output: FinalOutput):
         """Export human-readable summary"""
         output_file = f"{config.OUTPUT_DIRECTORY}/meeting_summary.txt"
         
+        # stream lines straight to the file instead of writing one big
+        # pre-joined string
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(final_output.meeting_summary)
-        
-        print(f"✓ Exported summary to: {output_file}")
+            f.writelines(f"{line}\n" for line in self._summary_lines())
+
+        logger.success(f"Exported summary to: {output_file}")
 
 
 def run_agent(transcript_path: str, people_path: str, reference_date=None) -> FinalOutput:
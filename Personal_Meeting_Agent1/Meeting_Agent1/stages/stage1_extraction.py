@@ -1,7 +1,7 @@
 """Stage 1: Extract action items, decisions and risks from transcript"""
 from loguru import logger
 from models import ActionItem, Decision, Risk, MeetingState
-from utils import call_openai_with_retry, parse_json_safely
+from utils import call_openai_with_retry, parse_json_safely, truncate_text
 
 
 def extract_intelligence(state: MeetingState) -> MeetingState:
@@ -46,12 +46,13 @@ def extract_intelligence(state: MeetingState) -> MeetingState:
     return state
 
 
-def create_extraction_prompt(transcript: str) -> str:
-    # TODO: could probably optimize this prompt further
-    return f"""You are analyzing a meeting transcript. Your job is to find:
+# static instructions live in a module constant and come first in the
+# prompt; only the transcript varies, so providers that cache byte-identical
+# prompt prefixes bill the instructions once
+_EXTRACTION_PREAMBLE = """You are analyzing a meeting transcript. Your job is to find:
 
 1. **ACTION ITEMS** - Tasks someone needs to complete
-2. **DECISIONS** - Important choices that were made  
+2. **DECISIONS** - Important choices that were made
 3. **RISKS & QUESTIONS** - Concerns or unresolved issues
 
 For each item, provide:
@@ -60,37 +61,43 @@ For each item, provide:
 - Deadline (the exact phrase used, like "by Friday" or "next week")
 - Evidence (direct quotes with timestamps that prove this came from the meeting)
 
-Here's the meeting:
-{transcript}
-
 Respond with ONLY valid JSON in this format:
-{{
+{
   "action_items": [
-    {{
+    {
       "description": "Clear description of the task",
       "owner_name": "Person Name or null",
       "deadline_text": "deadline phrase or null",
       "evidence": ["[HH:MM] Speaker: exact quote"]
-    }}
+    }
   ],
   "decisions": [
-    {{
+    {
       "description": "What was decided",
       "made_by": "Person Name or null",
       "evidence": ["[HH:MM] Speaker: exact quote"],
       "timestamp": "[HH:MM]"
-    }}
+    }
   ],
   "risks": [
-    {{
+    {
       "description": "The risk or question",
       "category": "risk or open_question",
       "mentioned_by": "Person Name or null",
       "evidence": ["[HH:MM] Speaker: exact quote"],
       "timestamp": "[HH:MM]"
-    }}
+    }
   ]
-}}"""
+}
+
+---
+Here's the meeting:
+"""
+
+
+def create_extraction_prompt(transcript: str) -> str:
+    # static prefix first, dynamic transcript last (prompt-cache friendly)
+    return _EXTRACTION_PREAMBLE + transcript
 
 
 def convert_to_action_items(raw_items: list) -> list[ActionItem]:
@@ -99,12 +106,15 @@ def convert_to_action_items(raw_items: list) -> list[ActionItem]:
     
     for idx, item in enumerate(raw_items):
         try:
+            evidence = item.get("evidence", [])
             action_items.append(ActionItem(
                 id=f"action_{idx+1}",
                 description=item["description"],
                 owner_name=item.get("owner_name"),
                 deadline_text=item.get("deadline_text"),
-                evidence=item.get("evidence", [])
+                evidence=evidence,
+                # truncate once here; downstream prompts use the preview
+                evidence_preview=[truncate_text(e, 200) for e in evidence[:2]]
             ))
         except Exception as e:
             logger.warning(f"Skipped malformed action item: {e}")
@@ -0,0 +1,199 @@
+"""Stages 2+3 combined: resolve owners and deadlines in one LLM round-trip"""
+import json
+import orjson
+from datetime import date
+from models import MeetingState
+import config
+from utils import call_openai_with_retry, clean_json_response
+from stages.stage2_owner_resolution import find_exact_match
+from stages.stage3_deadline_resolution import parse_relative_date
+
+
+# static instructions for both resolution jobs - hoisted so the prompt
+# prefix stays byte-identical across calls
+_COMBINED_RULES = """You resolve two things about meeting action items in one pass:
+
+1. OWNERS - match each unresolved owner to the correct person from the people directory. Consider:
+- Name variations (e.g., "Emily" → "Emily Carter")
+- Role inference (e.g., "backend work" → Backend Engineer)
+- Context from evidence quotes
+
+2. DEADLINES - convert deadline phrases to ISO dates. Rules:
+- "next [day]" means the upcoming occurrence of that day
+- "by [day]" usually means the next occurrence
+- "in X weeks" means X*7 days from today
+- "end of week" typically means Friday
+- Be consistent and logical
+
+Respond ONLY with valid JSON:
+{
+  "matches": [
+    {
+      "action_id": "action_1",
+      "matched_name": "Full Name from directory",
+      "confidence": 0.95,
+      "reasoning": "Brief explanation"
+    }
+  ],
+  "deadlines": [
+    {
+      "action_id": "action_1",
+      "resolved_date": "2026-01-17",
+      "reasoning": "Brief explanation"
+    }
+  ]
+}"""
+
+
+def resolve_owners_and_deadlines(state: MeetingState) -> MeetingState:
+    """
+    Fused owner + deadline resolution
+
+    Runs both deterministic passes first, then clears everything still
+    unresolved with a single combined LLM call instead of one call per
+    stage - half the round-trips and one shared people-directory prefix.
+    """
+    # deterministic owner pass (see stage 2)
+    index = state.name_index
+    exact = 0
+    for action in state.action_items:
+        if action.owner_name:
+            if index is not None:
+                person = index.find(action.owner_name)
+            else:
+                person = find_exact_match(action.owner_name, state.people_directory)
+            if person:
+                action.owner_email = person.email
+                action.owner_role = person.role
+                action.confidence = 1.0
+                exact += 1
+
+    state.processing_notes.append(f"Stage 2: Found {exact} exact matches")
+
+    # deterministic deadline pass (see stage 3)
+    det_cnt = 0
+    for action in state.action_items:
+        if action.deadline_text:
+            resolved = parse_relative_date(action.deadline_text, state.reference_date)
+            if resolved:
+                action.deadline_date = resolved
+                det_cnt += 1
+
+    state.processing_notes.append(
+        f"Stage 3: Resolved {det_cnt} deadlines deterministically"
+    )
+
+    # collect what's left for the single combined LLM call
+    unresolved_owners = []
+    unresolved_deadlines = []
+    for action in state.action_items:
+        if action.owner_name and not action.owner_email:
+            unresolved_owners.append({
+                "id": action.id,
+                "description": action.description,
+                "owner_name": action.owner_name,
+                "evidence": action.evidence_preview  # pre-truncated at stage 1
+            })
+        if action.deadline_text and not action.deadline_date:
+            unresolved_deadlines.append({
+                "id": action.id,
+                "deadline_text": action.deadline_text,
+                "evidence": action.evidence_preview
+            })
+
+    if unresolved_owners or unresolved_deadlines:
+        state = _resolve_with_llm(state, unresolved_owners, unresolved_deadlines)
+    else:
+        state.processing_notes.append("Stages 2+3: Nothing left for the LLM")
+
+    # mark anything still unresolved (same flags the separate stages set)
+    for action in state.action_items:
+        if not action.owner_email:
+            action.needs_review = True
+            action.validation_notes.append("Owner could not be resolved")
+        if action.deadline_text and not action.deadline_date:
+            action.needs_review = True
+            action.validation_notes.append(
+                f"Could not resolve deadline: '{action.deadline_text}'"
+            )
+
+    state.stage_completed = "deadline_resolution"
+    return state
+
+
+def _resolve_with_llm(state: MeetingState, unresolved_owners: list,
+                      unresolved_deadlines: list) -> MeetingState:
+    # one prompt covering both jobs: static rules first, per-run
+    # directory and date next, per-call actions last (prompt-cache friendly)
+    weekday = state.reference_date.strftime("%A")
+
+    prompt = f"""{_COMBINED_RULES}
+
+People Directory:
+{state.people_directory_prompt}
+
+Today is {state.reference_date} ({weekday}).
+
+Unresolved Owners:
+{json.dumps(unresolved_owners, indent=2)}
+
+Unresolved Deadlines:
+{json.dumps(unresolved_deadlines, indent=2)}"""
+
+    try:
+        resp = call_openai_with_retry(
+            prompt=prompt,
+            system_message="You are an expert at matching names and resolving dates. Output only valid JSON.",
+            max_tokens=3000
+        )
+
+        result = orjson.loads(clean_json_response(resp))
+
+        actions_by_id = {a.id: a for a in state.action_items}
+
+        # apply owner matches
+        owner_cnt = 0
+        for match in result.get("matches", []):
+            matched_name = match.get("matched_name")
+            action = actions_by_id.get(match.get("action_id"))
+
+            if action and matched_name in state.people_directory:
+                person = state.people_directory[matched_name]
+                confidence = match.get("confidence", 0.0)
+
+                action.owner_name = matched_name
+                action.owner_email = person.email
+                action.owner_role = person.role
+                action.confidence = confidence
+
+                # flag low confidence matches for review
+                if confidence < config.CONFIDENCE_THRESHOLD:
+                    action.needs_review = True
+                    action.validation_notes.append(
+                        f"Low confidence match ({confidence:.2f}): {match.get('reasoning', '')}"
+                    )
+
+                owner_cnt += 1
+
+        # apply resolved dates
+        deadline_cnt = 0
+        for deadline in result.get("deadlines", []):
+            action = actions_by_id.get(deadline.get("action_id"))
+            date_str = deadline.get("resolved_date")
+
+            if action and date_str:
+                try:
+                    action.deadline_date = date.fromisoformat(date_str)
+                    deadline_cnt += 1
+                except ValueError:
+                    pass  # skip invalid dates
+
+        state.processing_notes.append(
+            f"Stages 2+3: LLM resolved {owner_cnt} owners and {deadline_cnt} deadlines"
+        )
+
+        return state
+
+    except Exception as e:
+        state.processing_notes.append(f"Stages 2+3 LLM ERROR: {str(e)}")
+        return state  # continue with partial results
@@ -1,11 +1,32 @@
 """Stage 2: Owner Resolution - matches owners to people directory"""
 import json
+import orjson
 from typing import Dict, Optional
 from models import MeetingState, Person
 import config
 from utils import call_openai_with_retry, clean_json_response
 
 
+# static matching instructions - hoisted so the prompt prefix stays
+# byte-identical across calls
+_MATCHING_RULES = """Match each unresolved action item to the correct person from the people directory. Consider:
+- Name variations (e.g., "Emily" → "Emily Carter")
+- Role inference (e.g., "backend work" → Backend Engineer)
+- Context from evidence quotes
+
+Respond ONLY with valid JSON:
+{
+  "matches": [
+    {
+      "action_id": "action_1",
+      "matched_name": "Full Name from directory",
+      "confidence": 0.95,
+      "reasoning": "Brief explanation"
+    }
+  ]
+}"""
+
+
 def normalize_name(name: str) -> str:
     if not name:
         return ""
@@ -13,34 +34,28 @@ def normalize_name(name: str) -> str:
 
 
 def find_exact_match(owner_name: str, people_dir: Dict[str, Person]) -> Optional[Person]:
+    # fallback scan for callers without a prebuilt index
     if not owner_name:
         return None
-    
+
     norm = normalize_name(owner_name)
-    
+
     for person_name, person in people_dir.items():
         if normalize_name(person_name) == norm:
             return person
-        
+
         # also check just first name
         first_name = person_name.split()[0].lower()
         if norm == first_name:
             return person
-    
+
     return None
 
 
 def resolve_owners_with_llm(state: MeetingState) -> MeetingState:
     """Use LLM to resolve ambiguous names and infer from roles"""
-    # build people directory string for prompt
-    people_list = []
-    for name, person in state.people_directory.items():
-        people_list.append(f"- {name} ({person.role}) - {person.email}")
-    
-    people_str = "\n".join(people_list)
-    # print(f"DEBUG: {len(people_list)} people in directory")  # useful for debugging
-    
-    # get actions that still need resolution
+    # check for unresolved actions first - on clean transcripts this
+    # returns before any directory/prompt string work happens
     unresolved = []
     for action in state.action_items:
         if action.owner_name and not action.owner_email:
@@ -48,38 +63,26 @@ def resolve_owners_with_llm(state: MeetingState) -> MeetingState:
                 "id": action.id,
                 "description": action.description,
                 "owner_name": action.owner_name,
-                "evidence": action.evidence
+                "evidence": action.evidence_preview  # pre-truncated at stage 1
             })
-    
+
     if not unresolved:
         state.processing_notes.append("Stage 2: No unresolved owners")
         return state
-    
-    # TODO: maybe cache this prompt template?
-    prompt = f"""Given this people directory and action items, match each action to the correct person.
+
+    # stable serialized directory - byte-identical across stages so the
+    # provider's prompt-prefix cache can reuse it
+    people_str = state.people_directory_prompt
+
+    # static rules first, per-run directory next, per-call actions last -
+    # keeps the cacheable prompt prefix byte-identical across calls
+    prompt = f"""{_MATCHING_RULES}
 
 People Directory:
 {people_str}
 
 Unresolved Actions:
-{json.dumps(unresolved, indent=2)}
-
-For each action, determine the best matching person from the directory. Consider:
-- Name variations (e.g., "Emily" → "Emily Carter")
-- Role inference (e.g., "backend work" → Backend Engineer)
-- Context from evidence quotes
-
-Respond ONLY with valid JSON:
-{{
-  "matches": [
-    {{
-      "action_id": "action_1",
-      "matched_name": "Full Name from directory",
-      "confidence": 0.95,
-      "reasoning": "Brief explanation"
-    }}
-  ]
-}}"""
+{json.dumps(unresolved, indent=2)}"""
 
     try:
         result_text = call_openai_with_retry(
@@ -90,36 +93,34 @@ Respond ONLY with valid JSON:
         
         result_text = clean_json_response(result_text)
         result_text = result_text.strip()
+
+        result = orjson.loads(result_text)
         
-        result = json.loads(result_text)
-        
-        # apply the matches
+        # apply the matches (dict lookup instead of scanning the action
+        # list once per match)
+        actions_by_id = {a.id: a for a in state.action_items}
         cnt = 0
         for match in result.get("matches", []):
-            action_id = match.get("action_id")
             matched_name = match.get("matched_name")
             confidence = match.get("confidence", 0.0)
-            
-            if matched_name in state.people_directory:
+            action = actions_by_id.get(match.get("action_id"))
+
+            if action and matched_name in state.people_directory:
                 person = state.people_directory[matched_name]
-                
-                # find and update the action
-                for action in state.action_items:
-                    if action.id == action_id:
-                        action.owner_name = matched_name
-                        action.owner_email = person.email
-                        action.owner_role = person.role
-                        action.confidence = confidence
-                        
-                        # flag low confidence matches for review
-                        if confidence < config.CONFIDENCE_THRESHOLD:
-                            action.needs_review = True
-                            action.validation_notes.append(
-                                f"Low confidence match ({confidence:.2f}): {match.get('reasoning', '')}"
-                            )
-                        
-                        cnt += 1
-                        break
+
+                action.owner_name = matched_name
+                action.owner_email = person.email
+                action.owner_role = person.role
+                action.confidence = confidence
+
+                # flag low confidence matches for review
+                if confidence < config.CONFIDENCE_THRESHOLD:
+                    action.needs_review = True
+                    action.validation_notes.append(
+                        f"Low confidence match ({confidence:.2f}): {match.get('reasoning', '')}"
+                    )
+
+                cnt += 1
         
         state.stage_completed = "owner_resolution"
         state.processing_notes.append(
@@ -135,11 +136,16 @@ Respond ONLY with valid JSON:
 
 def resolve_owners(state: MeetingState) -> MeetingState:
     """Main entry point for owner resolution"""
-    # first pass - try exact matches
+    # first pass - try exact matches (dict lookups via the prebuilt
+    # index; fall back to the linear scan if a caller didn't build one)
+    index = state.name_index
     exact = 0
     for action in state.action_items:
         if action.owner_name:
-            person = find_exact_match(action.owner_name, state.people_directory)
+            if index is not None:
+                person = index.find(action.owner_name)
+            else:
+                person = find_exact_match(action.owner_name, state.people_directory)
             if person:
                 action.owner_email = person.email
                 action.owner_role = person.role
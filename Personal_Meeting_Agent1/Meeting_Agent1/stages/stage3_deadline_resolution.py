@@ -1,86 +1,152 @@
 """Stage 3: Deadline Resolution - convert relative dates to absolute ISO dates"""
 import json
+import orjson
 import re
 from datetime import timedelta, date
+from functools import lru_cache
 from typing import Optional
+
+# optional: google-re2 compiles to a DFA and matches in linear time
+# with no backtracking; fall back to stdlib re when it isn't installed
+# (the combined pattern below uses no backreferences, so both work)
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
 from models import MeetingState
 import config
 from utils import call_openai_with_retry, clean_json_response
 
 
+# hoisted parsing tables/patterns - built once at import instead of on
+# every parse_relative_date call
+WEEKDAYS = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6
+}
+
+_TODAY_PHRASES = frozenset(["today", "by today", "eod", "end of day", "today eod"])
+_TOMORROW_PHRASES = frozenset(["tomorrow", "by tomorrow", "tomorrow eod", "by tomorrow eod"])
+
+# fixed day offsets for the exact today/tomorrow phrases
+_EXACT_OFFSETS = {phrase: 0 for phrase in _TODAY_PHRASES}
+_EXACT_OFFSETS.update({phrase: 1 for phrase in _TOMORROW_PHRASES})
+
+_WEEKDAY_NAMES = '|'.join(WEEKDAYS)
+
+# one combined pattern with named groups replaces the old ladder of
+# per-pattern re.search calls and substring scans
+_DEADLINE_RE = _re.compile(
+    r'in (?P<ndays>\d+) days?'
+    r'|in (?P<nweeks>\d+) weeks?'
+    rf'|(?:next|by) (?P<wday_next>{_WEEKDAY_NAMES})'
+    rf'|this (?P<wday_this>{_WEEKDAY_NAMES})'
+    r'|(?P<eow>end of week|eow)'
+    r'|(?P<nextweek>next week)'
+)
+
+# the old code checked pattern kinds in a fixed order, not left-to-right;
+# keep that order when several patterns appear in one phrase
+_GROUP_PRIORITY = {
+    'ndays': 0, 'nweeks': 1, 'wday_next': 2,
+    'wday_this': 3, 'eow': 4, 'nextweek': 5
+}
+
+# static resolution rules - hoisted so the prompt prefix stays
+# byte-identical across calls
+_DEADLINE_RULES = """You convert deadline phrases to ISO dates.
+
+Rules:
+- "next [day]" means the upcoming occurrence of that day
+- "by [day]" usually means the next occurrence
+- "in X weeks" means X*7 days from today
+- "end of week" typically means Friday
+- Be consistent and logical
+
+Respond ONLY with valid JSON:
+{
+  "deadlines": [
+    {
+      "action_id": "action_1",
+      "resolved_date": "2026-01-17",
+      "reasoning": "Brief explanation"
+    }
+  ]
+}"""
+
+
+def _next_weekday(day_num: int, reference_date: date) -> date:
+    days_ahead = day_num - reference_date.weekday()
+    if days_ahead <= 0:  # target day already passed this week
+        days_ahead += 7
+    return reference_date + timedelta(days=days_ahead)
+
+
 def parse_relative_date(deadline_text: str, reference_date: date) -> Optional[date]:
     # parse common patterns like "tomorrow", "next friday", etc
     # print(f"DEBUG: parsing '{deadline_text}'")  # useful for debugging
     if not deadline_text:
         return None
-    
-    txt = deadline_text.lower().strip()
-    
-    # today/tomorrow patterns
-    if txt in ["today", "by today", "eod", "end of day", "today eod"]:
-        return reference_date
-    
-    if txt in ["tomorrow", "by tomorrow", "tomorrow eod", "by tomorrow eod"]:
-        return reference_date + timedelta(days=1)
-    
-    # "in X days/weeks"
-    match = re.search(r'in (\d+) days?', txt)
-    if match:
-        i = int(match.group(1))  # days count
-        return reference_date + timedelta(days=i)
-    
-    match = re.search(r'in (\d+) weeks?', txt)
-    if match:
-        weeks = int(match.group(1))
-        return reference_date + timedelta(weeks=weeks)
-    
-    # weekday names - next monday, this friday, etc
-    # TODO: add support for "two weeks from now" patterns
-    weekdays = {
-        'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-        'friday': 4, 'saturday': 5, 'sunday': 6
-    }
-    
-    # this is a bit repetitive but it works
-    for day_name, day_num in weekdays.items():
-        if f'next {day_name}' in txt or f'by {day_name}' in txt:
-            days_ahead = day_num - reference_date.weekday()
-            if days_ahead <= 0:  # target day already passed this week
-                days_ahead += 7
-            return reference_date + timedelta(days=days_ahead)
-    
-    # "this Friday" - within current week
-    for day_name, day_num in weekdays.items():
-        if f'this {day_name}' in txt:
-            days_ahead = day_num - reference_date.weekday()
-            if days_ahead < 0:
-                days_ahead += 7
-            return reference_date + timedelta(days=days_ahead)
-    
-    # "Friday" alone (assume current or next week)
-    for day_name, day_num in weekdays.items():
-        if txt == day_name or txt == f'by {day_name}':
-            days_ahead = day_num - reference_date.weekday()
-            if days_ahead <= 0:
-                days_ahead += 7
-            return reference_date + timedelta(days=days_ahead)
-    
-    # "end of week" - assume Friday
-    if 'end of week' in txt or 'eow' in txt:
+
+    # memoized on (normalized text, reference ordinal) - repeated phrases
+    # like "by friday" across actions hit the cache instead of re-parsing
+    ordinal = _parse_cached(deadline_text.lower().strip(), reference_date.toordinal())
+    return date.fromordinal(ordinal) if ordinal is not None else None
+
+
+@lru_cache(maxsize=256)
+def _parse_cached(txt: str, ref_ordinal: int) -> Optional[int]:
+    reference_date = date.fromordinal(ref_ordinal)
+
+    # exact phrases: today/tomorrow variants...
+    offset = _EXACT_OFFSETS.get(txt)
+    if offset is not None:
+        return ref_ordinal + offset
+
+    # ...and "friday" / "by friday" alone (assume current or next week)
+    day_num = WEEKDAYS.get(txt[3:] if txt.startswith('by ') else txt)
+    if day_num is not None:
+        return _next_weekday(day_num, reference_date).toordinal()
+
+    # everything else: one scan with the combined pattern, keeping the
+    # best match per the original checking order
+    best = None
+    best_rank = len(_GROUP_PRIORITY)
+    for m in _DEADLINE_RE.finditer(txt):
+        rank = _GROUP_PRIORITY[m.lastgroup]
+        if rank < best_rank:
+            best, best_rank = m, rank
+            if rank == 0:
+                break
+
+    if best is None:
+        return None
+
+    group = best.lastgroup
+    if group == 'ndays':
+        return ref_ordinal + int(best.group('ndays'))
+    if group == 'nweeks':
+        return ref_ordinal + 7 * int(best.group('nweeks'))
+    if group == 'wday_next':
+        return _next_weekday(WEEKDAYS[best.group('wday_next')], reference_date).toordinal()
+    if group == 'wday_this':
+        # "this Friday" - within current week
+        days_ahead = WEEKDAYS[best.group('wday_this')] - reference_date.weekday()
+        if days_ahead < 0:
+            days_ahead += 7
+        return ref_ordinal + days_ahead
+    if group == 'eow':
+        # "end of week" - assume Friday
         days_to_friday = (4 - reference_date.weekday()) % 7
         # this math is a bit hacky but works
         if days_to_friday == 0:
             days_to_friday = 7
-        return reference_date + timedelta(days=days_to_friday)
-    
+        return ref_ordinal + days_to_friday
     # "next week" - assume Monday of next week
-    if 'next week' in txt:
-        days_to_monday = (7 - reference_date.weekday()) % 7
-        if days_to_monday == 0:
-            days_to_monday = 7
-        return reference_date + timedelta(days=days_to_monday)
-    
-    return None
+    days_to_monday = (7 - reference_date.weekday()) % 7
+    if days_to_monday == 0:
+        days_to_monday = 7
+    return ref_ordinal + days_to_monday
 
 
 def resolve_deadlines_with_llm(state: MeetingState) -> MeetingState:
@@ -92,37 +158,22 @@ def resolve_deadlines_with_llm(state: MeetingState) -> MeetingState:
             unresolved.append({
                 "id": action.id,
                 "deadline_text": action.deadline_text,
-                "evidence": action.evidence
+                "evidence": action.evidence_preview  # pre-truncated at stage 1
             })
     
     if not unresolved:
         return state
     
     tmp = state.reference_date.strftime("%A")  # e.g., "Monday"
-    
-    prompt = f"""Today is {state.reference_date} ({tmp}).
 
-Convert these deadline phrases to ISO dates (YYYY-MM-DD):
+    # static rules first, dynamic date + actions last (prompt-cache friendly)
+    prompt = f"""{_DEADLINE_RULES}
 
-{json.dumps(unresolved, indent=2)}
+Today is {state.reference_date} ({tmp}).
 
-Rules:
-- "next [day]" means the upcoming occurrence of that day
-- "by [day]" usually means the next occurrence
-- "in X weeks" means X*7 days from today
-- "end of week" typically means Friday
-- Be consistent and logical
+Convert these deadline phrases to ISO dates (YYYY-MM-DD):
 
-Respond ONLY with valid JSON:
-{{
-  "deadlines": [
-    {{
-      "action_id": "action_1",
-      "resolved_date": "2026-01-17",
-      "reasoning": "Brief explanation"
-    }}
-  ]
-}}"""
+{json.dumps(unresolved, indent=2)}"""
 
     try:
         resp = call_openai_with_retry(
@@ -134,24 +185,20 @@ Respond ONLY with valid JSON:
         
         resp = clean_json_response(resp)
         # TODO: validate date format before parsing?
-        result = json.loads(resp)
+        result = orjson.loads(resp)
         
-        # apply resolved dates
+        # apply resolved dates (dict lookup instead of scanning the
+        # action list once per resolved deadline)
+        actions_by_id = {a.id: a for a in state.action_items}
         cnt = 0
         for deadline in result.get("deadlines", []):
-            action_id = deadline.get("action_id")
+            action = actions_by_id.get(deadline.get("action_id"))
             date_str = deadline.get("resolved_date")
-            
-            if date_str:
+
+            if action and date_str:
                 try:
-                    res = date.fromisoformat(date_str)
-                    
-                    # find and update action
-                    for action in state.action_items:
-                        if action.id == action_id:
-                            action.deadline_date = res
-                            cnt += 1
-                            break
+                    action.deadline_date = date.fromisoformat(date_str)
+                    cnt += 1
                 except ValueError:
                     pass  # skip invalid dates
         
@@ -168,21 +215,27 @@ Respond ONLY with valid JSON:
 
 def resolve_deadlines(state: MeetingState) -> MeetingState:
     det_cnt = 0
-    
-    # first pass - deterministic rules
+    unresolved_cnt = 0
+
+    # first pass - deterministic rules (also tallies what's left so we
+    # know whether the LLM pass is needed at all)
     for action in state.action_items:
         if action.deadline_text:
             resolved = parse_relative_date(action.deadline_text, state.reference_date)
             if resolved:
                 action.deadline_date = resolved
                 det_cnt += 1
-    
+            else:
+                unresolved_cnt += 1
+
     state.processing_notes.append(
         f"Stage 3: Resolved {det_cnt} deadlines deterministically"
     )
-    
-    # second pass - LLM for complex cases
-    state = resolve_deadlines_with_llm(state)
+
+    # second pass - LLM for complex cases; skip the round-trip entirely
+    # when the deterministic parser handled everything
+    if unresolved_cnt:
+        state = resolve_deadlines_with_llm(state)
     
     # mark actions with missing deadlines
     for action in state.action_items:
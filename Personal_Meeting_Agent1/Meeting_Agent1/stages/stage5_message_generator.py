@@ -2,24 +2,69 @@
 Stage 5: Follow-up Message Generator
 Generates personalized follow-up messages for action item owners
 """
-import json
-from typing import Dict, List
+import orjson
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from loguru import logger
 from models import MeetingState, FollowUpMessage, ActionItem
 import config
 from utils import call_openai_with_retry, clean_json_response
 
 
+# static per-owner prompt template, parsed once at import; only the name
+# and the action list are substituted per call
+_MESSAGE_PROMPT_TMPL = """Generate a professional, personalized follow-up email for {owner_name}.
+
+Their assigned action items from the meeting:
+{actions_json}
+
+The email should:
+1. Be friendly but professional
+2. Clearly list each action item with its deadline
+3. Be concise (under 200 words)
+4. Include a clear subject line
+5. Encourage them to reach out if they have questions
+
+Respond ONLY with valid JSON:
+{{
+  "subject": "Follow-up: Your Action Items from [Meeting]",
+  "body": "Email body text with proper formatting"
+}}"""
+
+
+# static batch instructions - hoisted so the prompt prefix stays
+# byte-identical across calls
+_BATCH_RULES = """Generate professional, personalized follow-up emails for meeting action item owners.
+
+Each email should:
+1. Be friendly but professional
+2. Clearly list each of the owner's action items with its deadline
+3. Be concise (under 200 words)
+4. Include a clear subject line
+5. Encourage them to reach out if they have questions
+
+Respond ONLY with valid JSON containing EXACTLY one entry per owner, in the same order:
+{
+  "messages": [
+    {
+      "owner_email": "email from the input",
+      "subject": "Follow-up: Your Action Items from [Meeting]",
+      "body": "Email body text with proper formatting"
+    }
+  ]
+}"""
+
+
 def group_actions_by_owner(state: MeetingState) -> Dict[str, List[ActionItem]]:
     """Group action items by owner email"""
-    groups = {}
-    
+    groups = defaultdict(list)
+
     for action in state.action_items:
         if action.owner_email:
-            if action.owner_email not in groups:
-                groups[action.owner_email] = []
             groups[action.owner_email].append(action)
-    
-    return groups
+
+    return dict(groups)
 
 
 def generate_follow_up_message(
@@ -36,27 +81,14 @@ def generate_follow_up_message(
         action_info = {
             "description": action.description,
             "deadline": str(action.deadline_date) if action.deadline_date else "No deadline specified",
-            "evidence": action.evidence[:2] if action.evidence else []  # Limit evidence
+            "evidence": action.evidence_preview  # pre-truncated at stage 1
         }
         action_list.append(action_info)
     
-    prompt = f"""Generate a professional, personalized follow-up email for {owner_name}.
-
-Their assigned action items from the meeting:
-{json.dumps(action_list, indent=2)}
-
-The email should:
-1. Be friendly but professional
-2. Clearly list each action item with its deadline
-3. Be concise (under 200 words)
-4. Include a clear subject line
-5. Encourage them to reach out if they have questions
-
-Respond ONLY with valid JSON:
-{{
-  "subject": "Follow-up: Your Action Items from [Meeting]",
-  "body": "Email body text with proper formatting"
-}}"""
+    prompt = _MESSAGE_PROMPT_TMPL.format(
+        owner_name=owner_name,
+        actions_json=orjson.dumps(action_list, option=orjson.OPT_INDENT_2, default=str).decode()
+    )
 
     try:
         result_text = call_openai_with_retry(
@@ -69,7 +101,7 @@ Respond ONLY with valid JSON:
         # Clean markdown
         result_text = clean_json_response(result_text)
         
-        result = json.loads(result_text)
+        result = orjson.loads(result_text)
         
         return FollowUpMessage(
             to_email=owner_email,
@@ -101,33 +133,103 @@ Please let me know if you have any questions.
 Best regards""",
             action_items=[action.id for action in actions]
         )
+def generate_messages_batch(
+    owner_groups: Dict[str, List[ActionItem]]
+) -> Optional[List[FollowUpMessage]]:
+    """Generate all follow-up messages in ONE LLM call
+
+    Returns None when the response fails the one-message-per-owner
+    integrity check, so the caller can fall back to per-owner calls.
+    """
+    payload = []
+    for owner_email, actions in owner_groups.items():
+        payload.append({
+            "owner_name": actions[0].owner_name or "Team Member",
+            "owner_email": owner_email,
+            "actions": [
+                {
+                    "description": a.description,
+                    "deadline": str(a.deadline_date) if a.deadline_date else "No deadline specified"
+                }
+                for a in actions
+            ]
+        })
+
+    prompt = f"""{_BATCH_RULES}
+
+Owners and their assigned action items ({len(payload)} owners):
+{orjson.dumps(payload, option=orjson.OPT_INDENT_2, default=str).decode()}"""
+
+    try:
+        result_text = call_openai_with_retry(
+            prompt=prompt,
+            system_message="You are a professional meeting coordinator. Generate clear, actionable follow-up emails. Output only valid JSON.",
+            temperature=0.3,
+            max_tokens=config.LLM_MAX_TOKENS
+        )
+
+        result = orjson.loads(clean_json_response(result_text))
+        entries = result.get("messages", [])
+
+        # integrity check: exactly one message per owner or we bail out
+        if len(entries) != len(payload):
+            logger.warning(
+                f"Batch message generation returned {len(entries)} entries "
+                f"for {len(payload)} owners - falling back to per-owner calls"
+            )
+            return None
+
+        messages = []
+        for entry, (owner_email, actions) in zip(entries, owner_groups.items()):
+            messages.append(FollowUpMessage(
+                to_email=owner_email,
+                to_name=actions[0].owner_name or "Team Member",
+                subject=entry.get("subject", "Follow-up: Your Action Items"),
+                body=entry.get("body", ""),
+                action_items=[a.id for a in actions]
+            ))
+        return messages
+
+    except Exception as e:
+        logger.warning(f"Batch message generation failed ({e}) - falling back")
+        return None
+
+
 def generate_messages(state: MeetingState) -> MeetingState:
     """
     Generate follow-up messages for all action item owners
     """
+    # decision-only meetings: no actions means no one to write to
+    if not state.action_items:
+        state.processing_notes.append("Stage 5: No action items, no messages")
+        state.stage_completed = "message_generation"
+        return state
+
     # Group actions by owner
     owner_groups = group_actions_by_owner(state)
-    
+
     if not owner_groups:
         state.processing_notes.append("Stage 5: No owners to send messages to")
         state.stage_completed = "message_generation"
         return state
-    
-    # Generate message for each owner
-    messages = []
-    for owner_email, actions in owner_groups.items():
-        # Get owner name from first action
-        owner_name = actions[0].owner_name or "Team Member"
-        
-        message = generate_follow_up_message(
-            owner_name=owner_name,
-            owner_email=owner_email,
-            actions=actions,
-            state=state
-        )
-        
-        messages.append(message)
-    
+
+    # one batched call covers every owner; N round-trips collapse to 1
+    messages = generate_messages_batch(owner_groups)
+
+    if messages is None:
+        # fallback: independent per-owner calls, overlapped across threads
+        workers = min(config.MAX_CONCURRENCY, len(owner_groups))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            messages = list(executor.map(
+                lambda item: generate_follow_up_message(
+                    owner_name=item[1][0].owner_name or "Team Member",
+                    owner_email=item[0],
+                    actions=item[1],
+                    state=state
+                ),
+                owner_groups.items()
+            ))
+
     state.follow_up_messages = messages
     state.stage_completed = "message_generation"
     state.processing_notes.append(
@@ -4,8 +4,9 @@ Simulates email triggering without actually sending emails
 """
 from datetime import datetime
 from typing import List
+from loguru import logger
 from models import MeetingState, EmailTrigger, FollowUpMessage
-import json
+import orjson
 
 
 def simulate_email_trigger(message: FollowUpMessage) -> EmailTrigger:
@@ -37,11 +38,12 @@ def simulate_email_triggers(state: MeetingState) -> MeetingState:
         trigger = simulate_email_trigger(message)
         triggers.append(trigger)
         
-        # Log the trigger event
-        print(f"[EMAIL SIMULATED] To: {trigger.to_name} <{trigger.to}>")
-        print(f"[EMAIL SIMULATED] Subject: {trigger.subject}")
-        print(f"[EMAIL SIMULATED] Triggered at: {trigger.triggered_at}")
-        print("-" * 60)
+        # Log the trigger event - one buffered write per trigger instead
+        # of four separate stdout flushes
+        logger.info(
+            f"[EMAIL SIMULATED] To: {trigger.to_name} <{trigger.to}> | "
+            f"Subject: {trigger.subject} | Triggered at: {trigger.triggered_at}"
+        )
     
     state.email_triggers = triggers
     state.stage_completed = "email_simulation"
@@ -56,21 +58,14 @@ def export_email_logs(state: MeetingState, output_path: str) -> str:
     """
     Export email trigger logs to a JSON file
     """
-    logs = []
-    
-    for trigger in state.email_triggers:
-        logs.append({
-            "to": trigger.to,
-            "to_name": trigger.to_name,
-            "subject": trigger.subject,
-            "body": trigger.body,
-            "triggered_at": trigger.triggered_at.isoformat(),
-            "status": trigger.status
-        })
-    
+    # serialize the triggers directly via pydantic - drops the per-trigger
+    # dict build and the Python-level isoformat() loop
+    logs = [trigger.model_dump(mode="json") for trigger in state.email_triggers]
+
     log_file = f"{output_path}/email_triggers.json"
-    
-    with open(log_file, 'w', encoding='utf-8') as f:
-        json.dump(logs, f, indent=2, ensure_ascii=False)
+
+    # binary write of orjson's UTF-8 output - one serialize, one syscall
+    with open(log_file, 'wb') as f:
+        f.write(orjson.dumps(logs, option=orjson.OPT_INDENT_2, default=str))
     
     return log_file
@@ -4,6 +4,7 @@ Run this after setting up your API key to test the system
 """
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 def test_configuration():
     """Test that configuration is valid"""
@@ -20,6 +21,15 @@ def test_configuration():
         return False
 
 
+def _try_import(module):
+    """Import one module; return the error message or None on success"""
+    try:
+        __import__(module)
+        return None
+    except Exception as e:
+        return str(e)
+
+
 def test_imports():
     """Test that all modules can be imported"""
     print("\nTesting imports...")
@@ -28,21 +38,27 @@ def test_imports():
         "orchestrator",
         "stages.stage1_extraction",
         "stages.stage2_owner_resolution",
+        "stages.stage23_combined",
         "stages.stage3_deadline_resolution",
         "stages.stage4_validation_agent",
         "stages.stage5_message_generator",
         "stages.stage6_email_simulator"
     ]
-    
-    for module in modules:
-        try:
-            __import__(module)
+
+    # imports are I/O-bound (file stats + reads), so overlap them;
+    # the import lock keeps this safe and map() preserves order
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        errors = list(executor.map(_try_import, modules))
+
+    all_ok = True
+    for module, error in zip(modules, errors):
+        if error is None:
             print(f"✓ {module}")
-        except Exception as e:
-            print(f"✗ {module}: {e}")
-            return False
-    
-    return True
+        else:
+            print(f"✗ {module}: {error}")
+            all_ok = False
+
+    return all_ok
 
 
 def test_data_files():
@@ -1,5 +1,11 @@
 """Helper utilities - common functions used across stages"""
+import hashlib
 import json
+import orjson
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
 from typing import Optional
 from loguru import logger
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -17,6 +23,15 @@ logger.add(
 )
 
 
+# one pooled session for all OpenRouter calls - keep-alive reuses the
+# TCP+TLS connection instead of a fresh handshake per LLM call
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "Authorization": f"Bearer {config.OPENROUTER_API_KEY}",
+    "Content-Type": "application/json",
+})
+
+
 def clean_json_response(text: str) -> str:
     """
     Clean up AI responses that might have markdown formatting
@@ -30,18 +45,99 @@ def clean_json_response(text: str) -> str:
     Returns:
         Clean JSON string
     """
-    text = text.strip()
-    
-    # remove code block markers
-    if text.startswith("```json"):
-        text = text[7:]
-    elif text.startswith("```"):
-        text = text[3:]
-    
-    if text.endswith("```"):
-        text = text[:-3]
-    
-    return text.strip()
+    # removeprefix/removesuffix are C-implemented no-ops on clean input
+    # (bare "```" only strips when "```json" didn't, same as before)
+    return (
+        text.strip()
+        .removeprefix("```json")
+        .removeprefix("```")
+        .removesuffix("```")
+        .strip()
+    )
+
+
+# in-memory LRU hot tier over the disk cache: repeat hits within a run
+# skip the file read entirely; bounded so long sessions can't balloon
+_MEM_CACHE: OrderedDict = OrderedDict()
+_MEM_CACHE_MAX = 128
+_MEM_CACHE_LOCK = threading.Lock()  # stage 5 calls from worker threads
+
+
+def _mem_cache_get(key: str) -> Optional[str]:
+    with _MEM_CACHE_LOCK:
+        result = _MEM_CACHE.get(key)
+        if result is not None:
+            _MEM_CACHE.move_to_end(key)  # mark as recently used
+        return result
+
+
+def _mem_cache_put(key: str, result: str):
+    with _MEM_CACHE_LOCK:
+        _MEM_CACHE[key] = result
+        _MEM_CACHE.move_to_end(key)
+        while len(_MEM_CACHE) > _MEM_CACHE_MAX:
+            _MEM_CACHE.popitem(last=False)  # evict least recently used
+
+
+def _prune_llm_cache_dir():
+    # cap the on-disk entry count, dropping oldest files first
+    try:
+        entries = [
+            (e.stat().st_mtime, e.path)
+            for e in os.scandir(config.LLM_CACHE_DIR)
+            if e.name.endswith('.json')
+        ]
+        if len(entries) > config.LLM_CACHE_MAX_ENTRIES:
+            entries.sort()
+            for _, path in entries[:len(entries) - config.LLM_CACHE_MAX_ENTRIES]:
+                os.remove(path)
+    except OSError:
+        pass  # pruning is best-effort
+
+
+def _llm_cache_key(prompt: str, system_message: str, temperature: float, max_tokens: int) -> str:
+    # everything that affects the completion goes into the key
+    raw = f"{config.OPENROUTER_MODEL}|{temperature}|{max_tokens}|{system_message}|{prompt}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def _llm_cache_get(key: str) -> Optional[str]:
+    # hot tier first - no disk I/O on repeat hits
+    result = _mem_cache_get(key)
+    if result is not None:
+        return result
+
+    cache_file = os.path.join(config.LLM_CACHE_DIR, f"{key}.json")
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+
+        # expire week-old entries so stale completions don't linger
+        created_at = datetime.fromisoformat(entry['created_at'])
+        if (datetime.now() - created_at).total_seconds() > config.LLM_CACHE_TTL_SECONDS:
+            os.remove(cache_file)
+            return None
+
+        _mem_cache_put(key, entry['result'])  # promote to the hot tier
+        return entry['result']
+    except (OSError, ValueError, KeyError):
+        return None  # miss or unreadable entry
+
+
+def _llm_cache_put(key: str, result: str):
+    _mem_cache_put(key, result)
+    try:
+        os.makedirs(config.LLM_CACHE_DIR, exist_ok=True)
+        cache_file = os.path.join(config.LLM_CACHE_DIR, f"{key}.json")
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                "result": result,
+                "model": config.OPENROUTER_MODEL,
+                "created_at": datetime.now().isoformat()
+            }, f)
+        _prune_llm_cache_dir()
+    except OSError as e:
+        logger.warning(f"Could not write LLM cache entry: {e}")
 
 
 @retry(
@@ -52,25 +148,34 @@ def call_openai_with_retry(
     prompt: str,
     system_message: str = "You are a helpful assistant.",
     temperature: float = None,
-    max_tokens: int = None
+    max_tokens: int = None,
+    bypass_cache: bool = False
 ) -> str:
-    """Call OpenRouter API with auto-retry on failure"""
+    """Call OpenRouter API with auto-retry on failure
+
+    Responses are cached on disk keyed by a hash of the full request, so
+    re-running the same transcript skips the network round-trip entirely.
+    Pass bypass_cache=True to force a fresh completion.
+    """
     # use defaults from config if not specified
     if temperature is None:
         temperature = config.LLM_TEMPERATURE
     if max_tokens is None:
         max_tokens = config.LLM_MAX_TOKENS
-    
+
+    cache_key = _llm_cache_key(prompt, system_message, temperature, max_tokens)
+    if not bypass_cache:
+        cached = _llm_cache_get(cache_key)
+        if cached is not None:
+            logger.debug("LLM cache hit - skipping API call")
+            return cached
+
     # print(f"DEBUG: calling {config.OPENROUTER_MODEL}")  # for debugging
     logger.debug(f"Calling {config.OPENROUTER_MODEL}...")
     
-    # TODO: add request timeout?
-    resp = requests.post(
+    resp = _SESSION.post(
         url="https://openrouter.ai/api/v1/chat/completions",
-        headers={
-            "Authorization": f"Bearer {config.OPENROUTER_API_KEY}",
-            "Content-Type": "application/json",
-        },
+        timeout=(5, 60),  # (connect, read)
         json={
             "model": config.OPENROUTER_MODEL,
             "messages": [
@@ -87,9 +192,17 @@ def call_openai_with_retry(
         logger.error(f"OpenRouter API Error: {resp.status_code} - {err}")
         raise Exception(f"OpenRouter API failed: {err}")
     
-    result = resp.json()['choices'][0]['message']['content'].strip()
+    data = resp.json()
+    result = data['choices'][0]['message']['content'].strip()
     logger.debug(f"Got response ({len(result)} chars)")
-    
+
+    # log prompt-cache hits so we can verify prefix caching is working
+    cached_tokens = data.get('usage', {}).get('prompt_tokens_details', {}).get('cached_tokens')
+    if cached_tokens:
+        logger.debug(f"Prompt cache hit: {cached_tokens} cached tokens")
+
+    _llm_cache_put(cache_key, result)
+
     return result
 
 
@@ -103,7 +216,8 @@ def parse_json_safely(text: str, fallback: Optional[dict] = None) -> dict:
     """
     try:
         cleaned = clean_json_response(text)
-        return json.loads(cleaned)
+        # orjson parses in C; JSONDecodeError subclasses the stdlib one
+        return orjson.loads(cleaned)
     except json.JSONDecodeError as e:
         logger.warning(f"Failed to parse JSON: {str(e)}")
         if fallback is not None: